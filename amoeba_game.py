@@ -3,12 +3,21 @@ import time
 import signal
 import numpy as np
 import math
+import itertools
+import threading
 import matplotlib.pyplot as plt
 from matplotlib import colors
+from matplotlib.figure import Figure
 from amoeba_state import AmoebaState
 import constants
 from utils import *
 from glob import glob
+from player_host import PlayerHost
+from checkpoint import save_checkpoint, load_checkpoint, restore_game
+from zobrist import ZobristHash
+from plan_cache import MovePlanner
+from stall import StallDetector
+from dashboard import Dashboard
 from players.default_player import Player as DefaultPlayer
 from players.g1_player import Player as G1_Player
 from players.g2_player import Player as G2_Player
@@ -19,9 +28,15 @@ from players.g6_player import Player as G6_Player
 from players.g7_player import Player as G7_Player
 from players.g8_player import Player as G8_Player
 
+# Numbers the games of a process so that each one logs through its own logger and handlers
+_game_ids = itertools.count(1)
+
+# Parent of the per game loggers, which are built outside the logging manager so that no game ever registers one
+_module_logger = logging.getLogger(__name__)
+
 
 class AmoebaGame:
-    def __init__(self, args):
+    def __init__(self, args, player_factory=None, snapshot=None, dashboard=None):
         self.start_time = time.time()
         self.use_gui = not args.no_gui
         self.use_vid = not args.no_vid
@@ -37,7 +52,11 @@ class AmoebaGame:
             for f in old_files:
                 os.remove(f)
 
-        self.logger = logging.getLogger(__name__)
+        self.logger = logging.Logger("{}.{}".format(__name__, next(_game_ids)))
+        self.logger.parent = _module_logger
+        self.logger.disabled = False
+        self.player_logger = None
+        self.figure = plt.figure() if self.use_gui else None
         # create file handler which logs even debug messages
         if self.do_logging:
             self.logger.setLevel(logging.DEBUG)
@@ -47,13 +66,13 @@ class AmoebaGame:
             fh = logging.FileHandler(os.path.join(self.log_dir, 'debug.log'), mode="w")
             fh.setLevel(logging.DEBUG)
             fh.setFormatter(logging.Formatter('%(message)s'))
-            fh.addFilter(MainLoggingFilter(__name__))
+            fh.addFilter(MainLoggingFilter(self.logger.name))
             self.logger.addHandler(fh)
             result_path = os.path.join(self.log_dir, "results.log")
             rfh = logging.FileHandler(result_path, mode="w")
             rfh.setLevel(logging.INFO)
             rfh.setFormatter(logging.Formatter('%(message)s'))
-            rfh.addFilter(MainLoggingFilter(__name__))
+            rfh.addFilter(MainLoggingFilter(self.logger.name))
             self.logger.addHandler(rfh)
         else:
             if args.log_path:
@@ -65,7 +84,7 @@ class AmoebaGame:
                 rfh = logging.FileHandler(result_path, mode="w")
                 rfh.setLevel(logging.INFO)
                 rfh.setFormatter(logging.Formatter('%(message)s'))
-                rfh.addFilter(MainLoggingFilter(__name__))
+                rfh.addFilter(MainLoggingFilter(self.logger.name))
                 self.logger.addHandler(rfh)
             else:
                 self.logger.setLevel(logging.ERROR)
@@ -77,8 +96,15 @@ class AmoebaGame:
         else:
             self.logger.info("Initialise random number generator with seed {}".format(args.seed))
 
+        self.seed = args.seed
         self.rng = np.random.default_rng(args.seed)
 
+        self.sandbox = args.sandbox
+        # the initialization timeout is a SIGALRM, which only the main thread can arm
+        self.use_alarm = self.use_timeout and threading.current_thread() is threading.main_thread()
+        if self.use_timeout and not self.use_alarm:
+            self.logger.info("Player initialization is not timed outside of the main thread")
+        self.player_factory = player_factory
         self.player = None
         self.player_name = None
 
@@ -97,10 +123,42 @@ class AmoebaGame:
         self.after_last_move = None
         self.player_byte = 0
         self.history = []
-
-        self.initialize(args.size)
-        self.add_player(args.player)
-        self.play_game()
+        self.hash_history = []
+        self.zobrist = None
+        self.plan_stats = None
+        self.check_hashes = args.check_hashes
+        self.turn_outcome = None
+        self.stalled = False
+        self.stall_detector = None
+        if args.stall_detection:
+            self.stall_detector = StallDetector(self.goal_size, self.max_turns, window=args.stall_window,
+                                                confidence=args.stall_confidence, idle_turns=args.stall_idle_turns,
+                                                repeat_turns=args.stall_repeat_turns,
+                                                flat_turns=args.stall_flat_turns)
+        self.checkpoint_every = args.checkpoint_every
+        self.checkpoint_path = args.checkpoint_path
+        # a dashboard handed in belongs to the caller, who may show other games on it as well
+        self.dashboard = dashboard
+        owns_dashboard = False
+
+        try:
+            if self.dashboard is None and args.dashboard:
+                self.dashboard = Dashboard(args.address, args.port, not args.no_browser)
+                owns_dashboard = True
+            self.initialize(args.size)
+            self.add_player(args.player)
+            if snapshot is None and args.resume:
+                snapshot = load_checkpoint(args.resume)
+            if snapshot is not None:
+                restore_game(self, snapshot)
+                self.logger.info("Resumed game at turn {}".format(self.turns))
+            self.play_game()
+        finally:
+            if self.sandbox and self.player is not None:
+                self.player.close()
+            if owns_dashboard:
+                self.dashboard.close()
+            self.close_logging()
         self.end_time = time.time()
 
         print("\nTime taken: {}\n".format(self.end_time - self.start_time))
@@ -126,6 +184,8 @@ class AmoebaGame:
             else:
                 player_class = eval("G{}_Player".format(player_in))
                 player_name = "Group {}".format(player_in)
+            if self.player_factory is not None:
+                player_class = self.player_factory
 
             self.logger.info(
                 "Adding player {} from class {}".format(player_name, player_class.__module__))
@@ -134,14 +194,19 @@ class AmoebaGame:
 
             start_time = 0
             is_timeout = False
-            if self.use_timeout:
+            if self.use_alarm:
                 signal.signal(signal.SIGALRM, timeout_handler)
                 signal.alarm(constants.timeout)
             try:
                 start_time = time.time()
-                player = player_class(rng=self.rng, logger=self.get_player_logger(player_name),
-                                      metabolism=self.metabolism, goal_size=self.goal_size, precomp_dir=precomp_dir)
-                if self.use_timeout:
+                if self.sandbox:
+                    player = self.get_player_host(player_in, player_name, precomp_dir)
+                else:
+                    self.player_logger = self.get_player_logger(player_name)
+                    player = player_class(rng=self.rng, logger=self.player_logger,
+                                          metabolism=self.metabolism, goal_size=self.goal_size,
+                                          precomp_dir=precomp_dir)
+                if self.use_alarm:
                     signal.alarm(0)  # Clear alarm
             except TimeoutException:
                 is_timeout = True
@@ -160,10 +225,12 @@ class AmoebaGame:
             self.logger.error("Failed to insert player {} since invalid player name provided.".format(player_in))
 
     def get_player_logger(self, player_name):
-        player_logger = logging.getLogger("{}.{}".format(__name__, player_name))
+        player_logger = logging.Logger("{}.{}".format(self.logger.name, player_name))
+        player_logger.parent = self.logger
 
         if self.do_logging:
             player_logger.setLevel(logging.INFO)
+            player_logger.disabled = False
             # add handler to self.logger with filtering
             player_fh = logging.FileHandler(os.path.join(self.log_dir, '{}.log'.format(player_name)), mode="w")
             player_fh.setLevel(logging.DEBUG)
@@ -176,6 +243,22 @@ class AmoebaGame:
 
         return player_logger
 
+    def close_logging(self):
+        """Detaches and closes the file handlers of this game, its loggers stay usable but write nowhere"""
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+
+    def get_player_host(self, player_in, player_name, precomp_dir):
+        log_path = None
+        if self.do_logging:
+            log_path = os.path.join(self.log_dir, '{}.log'.format(player_name))
+            open(log_path, "w").close()
+
+        move_timeout = constants.timeout if self.use_timeout else None
+        return PlayerHost(player_in, self.seed, self.logger, metabolism=self.metabolism, goal_size=self.goal_size,
+                          precomp_dir=precomp_dir, log_path=log_path, move_timeout=move_timeout)
+
     def initialize(self, sl):
         for i in range(sl):
             for j in range(sl):
@@ -189,6 +272,7 @@ class AmoebaGame:
 
         for i, j in self.bacteria:
             self.map_state[i][j] = -1
+        self.zobrist = ZobristHash(self.map_state)
 
         if self.use_gui:
             self.frame_rendering()
@@ -196,14 +280,18 @@ class AmoebaGame:
             self.history.append(self.get_state())
 
         periphery, eatable_bacteria, movable_cells, amoeba = self.get_periphery_info(False)
-        self.after_last_move = AmoebaState(self.amoeba_size, amoeba, periphery, eatable_bacteria, movable_cells)
+        self.after_last_move = AmoebaState(self.amoeba_size, amoeba, periphery, eatable_bacteria, movable_cells,
+                                           self.zobrist.hashes())
+        self.hash_history.append(self.after_last_move.hashes)
 
     def find_indices(self, value):
         result = np.where(self.map_state == value)
         return list(zip(result[0], result[1]))
 
     def play_game(self):
-        while self.turns != self.max_turns:
+        if self.dashboard is not None:
+            self.publish_frame()
+        while self.turns < self.max_turns:
             self.turns += 1
             self.play_turn()
             print("Turn {} complete".format(self.turns))
@@ -214,14 +302,36 @@ class AmoebaGame:
                                                                                                      self.amoeba_size,
                                                                                                      self.goal_size))
                 break
+            if self.stall_detector is not None and self.stall_detector.update(
+                    self.turns, self.amoeba_size, self.zobrist.shape_hash, self.turn_outcome):
+                self.stalled = True
+                self.game_end = self.turns
+                report = self.stall_detector.report
+                print("Game stalled at turn {} ({})".format(self.turns, ", ".join(report["reasons"])))
+                self.logger.info("Game stalled at turn {} with size {}: {}, final size bound {} with {}".format(
+                    self.turns, self.amoeba_size, ", ".join(report["reasons"]), report["size_bound"],
+                    self.stall_detector.thresholds))
+                break
+            if self.checkpoint_every and self.turns % self.checkpoint_every == 0:
+                save_checkpoint(self, self.checkpoint_path)
 
+        if self.dashboard is not None:
+            self.publish_frame(done=True)
         if not self.goal_reached:
             print("Goal size not achieved...\n\nFinal size: {}\nGoal size: {}".format(self.amoeba_size, self.goal_size))
 
+        # players planning through a MovePlanner report how often their plans came from the cache
+        planner = getattr(self.player, "plans", None)
+        if isinstance(planner, MovePlanner):
+            self.plan_stats = planner.stats()
+            self.logger.info("Move plan cache: {hits} hits, {misses} misses, {rejected} rejected, "
+                             "hit rate {hit_rate:.1%}".format(**self.plan_stats))
+
     def play_turn(self):
         self.bacteria_move()
         periphery, eatable_bacteria, movable_cells, amoeba = self.get_periphery_info(True)
-        before_state = AmoebaState(self.amoeba_size, amoeba, periphery, eatable_bacteria, movable_cells)
+        before_state = AmoebaState(self.amoeba_size, amoeba, periphery, eatable_bacteria, movable_cells,
+                                   self.zobrist.hashes())
         returned_action = self.player.move(
             last_percept=self.after_last_move,
             current_percept=before_state,
@@ -234,10 +344,13 @@ class AmoebaGame:
                 print("Move Accepted!")
                 self.logger.debug("Received move from {}".format(self.player_name))
                 self.amoeba_move(retract, move)
+                self.turn_outcome = "moved" if len(move) else "idle"
             else:
                 print("Valid move, but causes separation, hence cancelled.")
                 self.logger.info("Invalid move from {} as it does not follow the rules".format(self.player_name))
+                self.turn_outcome = "invalid"
         else:
+            self.turn_outcome = "invalid"
             print("Invalid move")
             self.logger.info("Invalid move from {} as it doesn't follow the return format".format(self.player_name))
 
@@ -247,9 +360,20 @@ class AmoebaGame:
             self.frame_rendering()
         elif self.use_vid:
             self.history.append(self.get_state())
+        if self.dashboard is not None:
+            self.publish_frame()
+        if self.check_hashes:
+            drift = self.zobrist.verify(self.map_state)
+            if drift:
+                message = "Incremental hashes out of sync with the board on turn {}: {}".format(self.turns,
+                                                                                               ", ".join(drift))
+                self.logger.error(message)
+                raise AssertionError(message)
 
         periphery, eatable_bacteria, movable_cells, amoeba = self.get_periphery_info(False)
-        self.after_last_move = AmoebaState(self.amoeba_size, amoeba, periphery, eatable_bacteria, movable_cells)
+        self.after_last_move = AmoebaState(self.amoeba_size, amoeba, periphery, eatable_bacteria, movable_cells,
+                                           self.zobrist.hashes())
+        self.hash_history.append(self.after_last_move.hashes)
 
     def bacteria_move(self):
         for i, (x, y) in enumerate(self.bacteria):
@@ -269,6 +393,7 @@ class AmoebaGame:
 
             if move:
                 self.map_state[x][y] = 0
+                self.zobrist.toggle_bacteria(x, y)
                 if move == 'up':
                     y = (y - 1) % constants.map_dim
                 elif move == 'down':
@@ -279,6 +404,7 @@ class AmoebaGame:
                     x = (x + 1) % constants.map_dim
 
                 self.map_state[x][y] = -1
+                self.zobrist.toggle_bacteria(x, y)
                 self.bacteria[i] = (x, y)
 
     def get_periphery_info(self, edit):
@@ -341,6 +467,8 @@ class AmoebaGame:
         for i, j in bacteria:
             self.bacteria.remove((i, j))
             self.map_state[i][j] = 2
+            self.zobrist.toggle_bacteria(i, j)
+            self.zobrist.toggle_amoeba(i, j)
             self.amoeba_size += 1
 
     def check_action(self, action):
@@ -411,12 +539,16 @@ class AmoebaGame:
     def amoeba_move(self, retract, move):
         for i, j in retract:
             self.map_state[i][j] = 0
+            self.zobrist.toggle_amoeba(i, j)
             nbr = self.find_neighbor(i, j, 1)
             for x, y in nbr:
                 self.map_state[x][y] = 2
 
         for i, j in move:
+            if self.map_state[i][j] < 0:
+                self.zobrist.toggle_bacteria(i, j)
             self.map_state[i][j] = 2
+            self.zobrist.toggle_amoeba(i, j)
             nbr = self.find_neighbor(i, j, 2)
             for x, y in nbr:
                 if len(self.find_movable_neighbor(x, y)) == 0:
@@ -428,42 +560,32 @@ class AmoebaGame:
         self.bacteria += new_bacteria
         for i, j in new_bacteria:
             self.map_state[i][j] = -1
+            self.zobrist.toggle_bacteria(i, j)
 
     def get_state(self):
         return_dict = dict()
         return_dict['amoeba_size'] = self.amoeba_size
         return_dict['bacteria'] = self.bacteria[:]
         return_dict['map_state'] = np.copy(self.map_state)
+        return_dict['hashes'] = self.zobrist.hashes()
         return return_dict
 
-    def frame_rendering(self):
-        plt.clf()
-        plt.title(
-            "Turn {} - (m = {}, A = {}, d = {})".format(self.turns, self.metabolism, self.start_size, self.density))
-        ax = plt.gca()
+    def draw_frame(self, figure, turn, map_state, amoeba_size, msg):
+        figure.clf()
+        ax = figure.add_subplot()
+        ax.set_title("Turn {} - (m = {}, A = {}, d = {})".format(turn, self.metabolism, self.start_size, self.density))
 
         cmap = colors.ListedColormap(["#000000", "#666666", "#90EE90", "#02FFFF"])
         bounds = [-1, 0, 1, 2, 3]
         norm = colors.BoundaryNorm(bounds, cmap.N)
         x, y = np.meshgrid(list(range(100)), list(range(100)))
-        plt.pcolormesh(
+        ax.pcolormesh(
             x + 0.5,
             y + 0.5,
-            np.transpose(self.map_state),
+            np.transpose(map_state),
             cmap=cmap,
             norm=norm,
         )
-        '''
-        for x, y in state['bacteria']:
-            plt.plot(
-                x + 0.5,
-                y + 0.5,
-                color="black",
-                marker="o",
-                markersize=1,
-                markeredgecolor="black",
-            )
-        '''
         ax.set_xticklabels([])
         ax.set_yticklabels([])
         ax.xaxis.set_ticks_position("none")
@@ -474,27 +596,45 @@ class AmoebaGame:
         ax.set_ylim([0, 100])
         ax.invert_yaxis()
 
+        cell_values = [["{}/{}".format(amoeba_size, self.goal_size)], [msg]]
+
+        ax.table(
+            cellText=cell_values,
+            cellLoc='center',
+            rowLabels=['Amoeba Size', 'Game State'],
+            colLabels=[self.player_name],
+        )
+        figure.savefig("render/{}.png".format(turn))
+
+    def status_message(self):
         msg = "In progress..."
         if self.amoeba_size >= self.goal_size:
             msg = "Goal size achieved!"
+        elif self.stalled:
+            msg = "Game stalled."
         elif self.turns == self.max_turns:
             msg = "Goal size not achieved."
         elif self.turns == 0:
             msg = "Starting state."
+        return msg
 
-        cell_values = [["{}/{}".format(self.amoeba_size, self.goal_size)], [msg]]
-
-        plt.table(
-            cellText=cell_values,
-            cellLoc='center',
-            rowLabels=['Amoeba Size', 'Game State'],
-            colLabels=[self.player_name],
-        )
-        plt.savefig("render/{}.png".format(self.turns))
+    def frame_rendering(self):
+        self.draw_frame(self.figure, self.turns, self.map_state, self.amoeba_size, self.status_message())
 
         if self.use_gui:
             plt.pause(0.025)
 
+    def publish_frame(self, done=False):
+        self.dashboard.publish(self.turns, self.map_state, {
+            "player": self.player_name,
+            "size": self.amoeba_size,
+            "goal_size": self.goal_size,
+            "max_turns": self.max_turns,
+            "settings": "m = {}, A = {}, d = {}".format(self.metabolism, self.start_size, self.density),
+            "status": self.status_message(),
+            "done": done,
+        })
+
     def frame_rendering_post(self):
         os.makedirs("render", exist_ok=True)
 
@@ -502,43 +642,10 @@ class AmoebaGame:
         for f in old_files:
             os.remove(f)
 
+        # drawn on a figure of its own rather than pyplot's current one, so games rendering at the same time in
+        # one process don't draw over each other
+        figure = Figure()
         for i, state in enumerate(self.history):
-            plt.clf()
-            plt.title("Turn {} - (m = {}, A = {}, d = {})".format(i, self.metabolism, self.start_size, self.density))
-            ax = plt.gca()
-
-            cmap = colors.ListedColormap(["#000000", "#666666", "#90EE90", "#02FFFF"])
-            bounds = [-1, 0, 1, 2, 3]
-            norm = colors.BoundaryNorm(bounds, cmap.N)
-            x, y = np.meshgrid(list(range(100)), list(range(100)))
-            plt.pcolormesh(
-                x + 0.5,
-                y + 0.5,
-                np.transpose(state['map_state']),
-                cmap=cmap,
-                norm=norm,
-            )
-            '''
-            for x, y in state['bacteria']:
-                plt.plot(
-                    x + 0.5,
-                    y + 0.5,
-                    color="black",
-                    marker="o",
-                    markersize=1,
-                    markeredgecolor="black",
-                )
-            '''
-            ax.set_xticklabels([])
-            ax.set_yticklabels([])
-            ax.xaxis.set_ticks_position("none")
-            ax.yaxis.set_ticks_position("none")
-
-            ax.set_aspect(1)
-            ax.set_xlim([0, 100])
-            ax.set_ylim([0, 100])
-            ax.invert_yaxis()
-
             msg = "In progress..."
             if state['amoeba_size'] >= self.goal_size:
                 msg = "Goal size achieved!"
@@ -547,13 +654,4 @@ class AmoebaGame:
             elif i == 0:
                 msg = "Starting state."
 
-            cell_values = [["{}/{}".format(state['amoeba_size'], self.goal_size)], [msg]]
-
-            plt.table(
-                cellText=cell_values,
-                cellLoc='center',
-                rowLabels=['Amoeba Size', 'Game State'],
-                colLabels=[self.player_name],
-            )
-
-            plt.savefig("render/{}.png".format(i))
+            self.draw_frame(figure, i, state['map_state'], state['amoeba_size'], msg)
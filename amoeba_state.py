@@ -1,5 +1,5 @@
 class AmoebaState:
-    def __init__(self, current_size, amoeba_map, periphery, bacteria, movable_cells):
+    def __init__(self, current_size, amoeba_map, periphery, bacteria, movable_cells, hashes=None):
         """
             Args:
                 current_size (int): current size of the amoeba
@@ -7,9 +7,12 @@ class AmoebaState:
                 periphery (List[Tuple[int, int]]: list of cells on the periphery of the amoeba
                 bacteria (List[Tuple[int, int]]: list of bacteria known to the amoeba
                 movable_cells (List[Tuple[int, int]]: list of movable positions given the current amoeba state
+                hashes (dict): 64-bit Zobrist hashes of the board ("board"), the amoeba alone ("shape") and the
+                    amoeba up to translation ("normalised_shape")
         """
         self.current_size = current_size
         self.amoeba_map = amoeba_map
         self.periphery = periphery
         self.bacteria = bacteria
         self.movable_cells = movable_cells
+        self.hashes = hashes
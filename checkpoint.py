@@ -0,0 +1,150 @@
+import io
+import json
+import os
+import pickle
+
+import numpy as np
+
+from amoeba_state import AmoebaState
+
+# Stand-in for the game's random number generator inside pickled player state, players share the engine's
+# generator so it must be restored as the very same object rather than a copy
+RNG_ID = "game_rng"
+# Same for the player logger, which is bound to the handlers of the game the player is restored into
+LOGGER_ID = "game_logger"
+
+# Columns of the hash history table, one row of uint64 hashes per turn played
+HASH_FIELDS = ["board", "shape", "normalised_shape"]
+
+
+class _PlayerPickler(pickle.Pickler):
+    def __init__(self, file, rng, logger):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.rng = rng
+        self.logger = logger
+
+    def persistent_id(self, obj):
+        if obj is self.rng:
+            return RNG_ID
+        if self.logger is not None and obj is self.logger:
+            return LOGGER_ID
+        return None
+
+
+class _PlayerUnpickler(pickle.Unpickler):
+    def __init__(self, file, rng, logger):
+        super().__init__(file)
+        self.rng = rng
+        self.logger = logger
+
+    def persistent_load(self, pid):
+        if pid == RNG_ID:
+            return self.rng
+        if pid == LOGGER_ID:
+            return self.logger
+        raise pickle.UnpicklingError("Unknown persistent id {}".format(pid))
+
+
+def _coords(cells):
+    return np.array(cells, dtype=np.int16).reshape(-1, 2)
+
+
+def _cells(coords):
+    return list(map(tuple, coords.tolist()))
+
+
+def dump_player(player, rng, logger=None):
+    """Pickles the player with references to the game rng and player logger kept symbolic, returns None if it
+    can't be pickled"""
+    buffer = io.BytesIO()
+    try:
+        _PlayerPickler(buffer, rng, logger).dump(player)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return buffer.getvalue()
+
+
+def load_player(data, rng, logger=None):
+    return _PlayerUnpickler(io.BytesIO(data), rng, logger).load()
+
+
+def snapshot_game(game):
+    """Captures everything the continuation of a game depends on, between two turns
+
+        Returns:
+            dict: numpy arrays only, the map as int8 and cell lists as int16 coordinate tables
+    """
+    state = game.after_last_move
+    snapshot = {
+        "map_state": game.map_state.astype(np.int8),
+        "bacteria": _coords(game.bacteria),
+        "counters": np.array([game.turns, game.amoeba_size, game.player_byte, state.current_size], dtype=np.int64),
+        "periphery": _coords(state.periphery),
+        "eatable_bacteria": _coords(state.bacteria),
+        "movable_cells": _coords(state.movable_cells),
+        "rng_state": np.array(json.dumps(game.rng.bit_generator.state)),
+        "turn_outcome": np.array(game.turn_outcome or ""),
+        "hash_history": np.array([[hashes[field] for field in HASH_FIELDS] for hashes in game.hash_history],
+                                 dtype=np.uint64).reshape(-1, len(HASH_FIELDS)),
+        "player": np.zeros(0, dtype=np.uint8),
+    }
+    if game.stall_detector is not None:
+        snapshot.update(game.stall_detector.snapshot())
+
+    player = None if game.sandbox else dump_player(game.player, game.rng, game.player_logger)
+    if player is None:
+        game.logger.info("Player state of {} not captured, continuation may differ".format(game.player_name))
+    else:
+        snapshot["player"] = np.frombuffer(player, dtype=np.uint8)
+
+    return snapshot
+
+
+def restore_game(game, snapshot):
+    """Puts a game back into the state captured by snapshot_game"""
+    game.map_state = snapshot["map_state"].astype(int)
+    game.bacteria = _cells(snapshot["bacteria"])
+    game.turns, game.amoeba_size, game.player_byte, current_size = snapshot["counters"].tolist()
+    game.rng.bit_generator.state = json.loads(str(snapshot["rng_state"]))
+    if "turn_outcome" in snapshot:
+        game.turn_outcome = str(snapshot["turn_outcome"]) or None
+    if game.stall_detector is not None:
+        if "stall_sizes" in snapshot:
+            game.stall_detector.restore(snapshot)
+        else:
+            game.logger.info("Stall detection state not in the snapshot, stalls are detected from this turn on")
+
+    game.zobrist.reset(game.map_state)
+
+    amoeba = np.copy(game.map_state)
+    amoeba[amoeba < 0] = 0
+    amoeba[amoeba > 0] = 1
+    game.after_last_move = AmoebaState(current_size, amoeba, _cells(snapshot["periphery"]),
+                                       _cells(snapshot["eatable_bacteria"]), _cells(snapshot["movable_cells"]),
+                                       game.zobrist.hashes())
+    if "hash_history" in snapshot:
+        game.hash_history = [dict(zip(HASH_FIELDS, row)) for row in snapshot["hash_history"].tolist()]
+    else:
+        game.logger.info("Hash history not in the snapshot, it only covers the turns from here on")
+        game.hash_history = [game.after_last_move.hashes]
+
+    if len(snapshot["player"]) and not game.sandbox:
+        game.player = load_player(snapshot["player"].tobytes(), game.rng, game.player_logger)
+
+    game.goal_reached = game.amoeba_size >= game.goal_size
+
+
+def save_checkpoint(game, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # written next to the target and renamed so a crash mid-write never leaves a truncated checkpoint behind
+    tmp_path = "{}.tmp.npz".format(path)
+    np.savez_compressed(tmp_path, **snapshot_game(game))
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
@@ -0,0 +1,338 @@
+import asyncio
+import json
+import queue
+import socket
+import threading
+import webbrowser
+from collections import deque
+
+import numpy as np
+
+import constants
+
+# Bytes a client may have queued before its stream waits to send newer frames, frames published meanwhile are merged
+CLIENT_BUFFER = 1 << 16
+
+# Seconds clients are given to receive the final frames when the dashboard closes
+CLOSE_TIMEOUT = 2.0
+
+# Finished games whose final frame is kept, for clients that connect later and on the page
+FINISHED_KEPT = 16
+
+# Frames a worker process may have on its way to the dashboard before it drops new ones
+FEED_SIZE = 64
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Amoeba</title>
+<style>
+  body { background: #222222; color: #eeeeee; font-family: sans-serif; margin: 20px; }
+  #games { display: flex; flex-wrap: wrap; gap: 20px; }
+  canvas { width: 400px; height: 400px; image-rendering: pixelated; border: 1px solid #555555; }
+  table { margin-bottom: 10px; border-collapse: collapse; }
+  td { padding: 2px 12px 2px 0; }
+</style>
+</head>
+<body>
+<div id="connection">Connecting...</div>
+<div id="games"></div>
+<template id="panel">
+  <div>
+    <table>
+      <tr><td>Player</td><td class="player">-</td><td>Turn</td><td class="turn">-</td></tr>
+      <tr><td>Amoeba Size</td><td class="size">-</td><td>Game State</td><td class="status">-</td></tr>
+      <tr><td>Settings</td><td class="settings">-</td><td>Turns skipped</td><td class="skipped">0</td></tr>
+    </table>
+    <canvas width="DIM" height="DIM"></canvas>
+  </div>
+</template>
+<script>
+  const dim = DIM;
+  const finishedKept = FINISHED_KEPT;
+  // same colors as the matplotlib frames, for bacteria, empty, interior and periphery cells
+  const palette = {"-1": [0, 0, 0], "0": [102, 102, 102], "1": [144, 238, 144], "2": [2, 255, 255]};
+  const games = new Map();
+  const finished = [];
+
+  function paint(game, cell, value) {
+    // cells are flat indices of map_state[x][y], x runs left to right and y top to bottom
+    const offset = ((cell % dim) * dim + Math.floor(cell / dim)) * 4;
+    const color = palette[value];
+    game.image.data[offset] = color[0];
+    game.image.data[offset + 1] = color[1];
+    game.image.data[offset + 2] = color[2];
+    game.image.data[offset + 3] = 255;
+  }
+
+  function panel(key) {
+    if (!games.has(key)) {
+      const element = document.getElementById("panel").content.firstElementChild.cloneNode(true);
+      document.getElementById("games").appendChild(element);
+      const context = element.querySelector("canvas").getContext("2d");
+      games.set(key, {element: element, context: context, image: context.createImageData(dim, dim),
+                      lastTurn: null, skipped: 0, pending: false, done: false});
+    }
+    return games.get(key);
+  }
+
+  function reset(game) {
+    for (let cell = 0; cell < dim * dim; cell++) paint(game, cell, 0);
+    game.lastTurn = null;
+    game.skipped = 0;
+  }
+
+  function show(game, field, value) {
+    game.element.querySelector("." + field).textContent = value;
+  }
+
+  const source = new EventSource("/events");
+  source.onopen = () => { document.getElementById("connection").textContent = "Live"; };
+  source.onmessage = (message) => {
+    const frame = JSON.parse(message.data);
+    const game = panel(frame.game);
+    if (frame.reset) reset(game);
+    for (let i = 0; i < frame.cells.length; i++) paint(game, frame.cells[i], frame.values[i]);
+    if (game.lastTurn !== null && frame.turn > game.lastTurn + 1) game.skipped += frame.turn - game.lastTurn - 1;
+    game.lastTurn = frame.turn;
+    show(game, "player", frame.player);
+    show(game, "turn", frame.turn + " / " + frame.max_turns);
+    show(game, "size", frame.size + " / " + frame.goal_size);
+    show(game, "status", frame.status);
+    show(game, "settings", frame.settings);
+    show(game, "skipped", game.skipped);
+    if (!game.pending) {
+      game.pending = true;
+      requestAnimationFrame(() => { game.context.putImageData(game.image, 0, 0); game.pending = false; });
+    }
+    if (frame.done && !game.done) {
+      game.done = true;
+      finished.push(frame.game);
+      while (finished.length > finishedKept) {
+        const key = finished.shift();
+        games.get(key).element.remove();
+        games.delete(key);
+      }
+    }
+  };
+  source.addEventListener("end", () => {
+    source.close();
+    document.getElementById("connection").textContent = "Finished";
+  });
+  source.onerror = () => { document.getElementById("connection").textContent = "Disconnected"; };
+</script>
+</body>
+</html>
+""".replace("FINISHED_KEPT", str(FINISHED_KEPT)).replace("DIM", str(constants.map_dim))
+
+
+class Dashboard:
+    def __init__(self, address, port, open_browser=True):
+        """Local web page that shows games live, served by an asyncio server on a thread of its own
+
+            Games publish their board after every turn and go on right away, publishing only hands a copy of the
+            board to the server's event loop, which keeps the newest frame of every game. Every client of the page
+            is sent Server-Sent Events holding, per game, the cells that changed since the board of that game it
+            last received, as flat indices and values. A client that can't keep up has its stream held back by the
+            size of its send buffer, the frames published in the meantime are merged into the next change lists
+            rather than queued, so slow clients see fewer turns but never slow the games down.
+
+            Games played in worker processes publish through a DashboardFeed, see follow.
+
+            Args:
+                address (str): address to bind the server to
+                port (int): port to bind the server to, -1 lets the system pick a free one
+                open_browser (bool): whether to open the page in the default browser once the server is up
+        """
+        self.address = address
+        self.port = max(port, 0)
+        self.frames = {}
+        self.finished = deque()
+        self.closing = False
+        self.clients = set()
+        self.writers = set()
+        self.server = None
+        self.error = None
+        self.feeder = None
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self.serve, name="dashboard", daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        if self.error is not None:
+            raise self.error
+
+        print("Dashboard running at {}".format(self.url))
+        if open_browser:
+            webbrowser.open(self.url)
+
+    @property
+    def url(self):
+        return "http://{}:{}/".format(self.address, self.port)
+
+    def serve(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(asyncio.start_server(self.handle, self.address, self.port))
+        except OSError as e:
+            self.error = e
+            self.ready.set()
+            return
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ready.set()
+        self.loop.run_forever()
+        self.loop.close()
+
+    def publish(self, turn, map_state, info, game="game"):
+        """Makes the board after a turn the newest frame of a game, without waiting on the server or its clients
+
+            Args:
+                turn (int): turn just played
+                map_state (numpy array): engine map
+                info (dict): json serializable fields shown next to the board, "done" marks the final frame
+                game (str): key of the game, every game gets a board of its own on the page
+        """
+        self.loop.call_soon_threadsafe(self.receive, game, (turn, map_state.astype(np.int8).ravel(), info))
+
+    def receive(self, game, frame):
+        """Stores a frame on the event loop, which owns the frames so that streams can read them between awaits"""
+        self.frames[game] = frame
+        if frame[2].get("done"):
+            self.finished.append(game)
+            while len(self.finished) > FINISHED_KEPT:
+                self.frames.pop(self.finished.popleft(), None)
+        for event in self.clients:
+            event.set()
+
+    def follow(self, feed_queue):
+        """Publishes the frames DashboardFeeds put into feed_queue until it yields None"""
+        def pump():
+            for game, turn, board, info in iter(feed_queue.get, None):
+                self.publish(turn, board, info, game)
+
+        self.feeder = threading.Thread(target=pump, name="dashboard-feed", daemon=True)
+        self.feeder.start()
+
+    async def handle(self, reader, writer):
+        self.writers.add(writer)
+        try:
+            request = (await reader.readline()).decode("latin-1").split()
+            while (await reader.readline()).strip():
+                pass
+            path = request[1] if len(request) > 1 else "/"
+            if path == "/events":
+                await self.stream(writer)
+            elif path == "/":
+                self.respond(writer, "200 OK", "text/html; charset=utf-8", PAGE.encode())
+                await writer.drain()
+            else:
+                self.respond(writer, "404 Not Found", "text/plain", b"Not found")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            # waits for the queued frames to be flushed, the final ones included
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.writers.discard(writer)
+
+    @staticmethod
+    def respond(writer, status, content_type, body):
+        writer.write("HTTP/1.1 {}\r\nContent-Type: {}\r\nContent-Length: {}\r\nConnection: close\r\n\r\n".format(
+            status, content_type, len(body)).encode() + body)
+
+    async def stream(self, writer):
+        # the kernel buffer is capped as well, otherwise a localhost socket queues megabytes of stale frames
+        writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, CLIENT_BUFFER)
+        writer.transport.set_write_buffer_limits(high=CLIENT_BUFFER)
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n\r\n")
+        event = asyncio.Event()
+        self.clients.add(event)
+        # board and frame of every game as last sent to this client
+        sent = {}
+        last = {}
+        try:
+            while True:
+                event.clear()
+                pending = [(game, frame) for game, frame in self.frames.items() if last.get(game) is not frame]
+                if not pending:
+                    if self.closing:
+                        break
+                    await event.wait()
+                    continue
+
+                for game, frame in pending:
+                    turn, board, info = frame
+                    previous = sent.get(game)
+                    cells = np.flatnonzero(board if previous is None else board != previous)
+                    message = dict(info, game=game, turn=turn, reset=previous is None, cells=cells.tolist(),
+                                   values=board[cells].tolist())
+                    writer.write(b"data: " + json.dumps(message, separators=(",", ":")).encode() + b"\n\n")
+                    sent[game], last[game] = board, frame
+                await writer.drain()
+
+                for game in [game for game in sent if game not in self.frames]:
+                    del sent[game], last[game]
+            writer.write(b"event: end\ndata: {}\n\n")
+            await writer.drain()
+        finally:
+            self.clients.discard(event)
+
+    async def shutdown(self, timeout):
+        """Gives the clients up to timeout seconds to receive the final frames, then drops the ones still behind"""
+        self.closing = True
+        self.server.close()
+        for event in self.clients:
+            event.set()
+        streams = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if streams:
+            await asyncio.wait(streams, timeout=timeout)
+        # closing would wait for the queued frames to be flushed, which the stopped loop would never do, aborted
+        # connections let their handlers finish on their own
+        for writer in self.writers:
+            writer.transport.abort()
+        streams = [task for task in streams if not task.done()]
+        if streams:
+            await asyncio.wait(streams, timeout=timeout)
+        for task in streams:
+            task.cancel()
+        await asyncio.gather(*streams, return_exceptions=True)
+        self.loop.stop()
+
+    def close(self, timeout=CLOSE_TIMEOUT):
+        """Stops serving, once the feed being followed, if any, has yielded None"""
+        if self.feeder is not None:
+            self.feeder.join()
+        if self.server is None or not self.thread.is_alive():
+            return
+        asyncio.run_coroutine_threadsafe(self.shutdown(timeout), self.loop)
+        self.thread.join(timeout + 1)
+
+
+class DashboardFeed:
+    def __init__(self, feed_queue, game):
+        """Publishes the frames of one game played in a worker process to the Dashboard following feed_queue
+
+            A frame that finds the bounded queue full is dropped, the next one carries the whole board anyway, so
+            the game never waits on the dashboard. Only the final frame waits for room, up to CLOSE_TIMEOUT.
+
+            Args:
+                feed_queue (multiprocessing.Queue): queue the dashboard's process passed to Dashboard.follow
+                game (str): key of the game on the dashboard
+        """
+        self.feed_queue = feed_queue
+        self.game = game
+
+    def publish(self, turn, map_state, info):
+        frame = (self.game, turn, map_state.astype(np.int8), info)
+        try:
+            if info.get("done"):
+                self.feed_queue.put(frame, timeout=CLOSE_TIMEOUT)
+            else:
+                self.feed_queue.put_nowait(frame)
+        except queue.Full:
+            pass
@@ -0,0 +1,311 @@
+import argparse
+import contextlib
+import copy
+import itertools
+import json
+import math
+import os
+import platform
+import time
+
+import numpy as np
+
+import constants
+from amoeba_game import AmoebaGame
+from worker_pool import game_args
+
+# Engine methods the suite times, in report order
+OPERATIONS = ["initialize", "bacteria_move", "get_periphery_info", "check_move", "amoeba_move", "add_bacteria"]
+
+BASELINE_PATH = os.path.join("benchmarks", "engine_baseline.json")
+
+# Share of the fastest and of the slowest calls left out of the trimmed mean
+TRIM = 0.2
+
+# Statistics a run can be compared to the baseline on, the minimum and the trimmed mean shrug off scheduler noise
+STATISTICS = ["min_ms", "trimmed_ms", "p50_ms"]
+
+
+def bench_game(size, density, seed):
+    """Builds a game that is set up but has not played any turn, to be driven method by method"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return AmoebaGame(game_args("d", seed, size=size, density=density, final=0))
+
+
+def set_amoeba(game, cells, seed):
+    """Replaces the amoeba by a block of cells at the map center and redraws the bacteria at the game density
+
+        The block is filled row by row, as square as cells allows. Cells next to a free cell are marked as
+        periphery, the way amoeba_move leaves them.
+    """
+    side = math.ceil(math.sqrt(cells))
+    amoeba = np.zeros((constants.map_dim, constants.map_dim), dtype=bool)
+    block = np.zeros(side * side, dtype=bool)
+    block[:cells] = True
+    start = constants.map_dim // 2 - side // 2
+    amoeba[start:start + side, start:start + side] = block.reshape(side, side)
+
+    inner = amoeba.copy()
+    for axis, shift in itertools.product((0, 1), (-1, 1)):
+        inner &= np.roll(amoeba, shift, axis=axis)
+    game.map_state = np.where(inner, 1, np.where(amoeba, 2, 0))
+    game.amoeba_size = cells
+    game.zobrist.reset(game.map_state)
+
+    game.rng = np.random.default_rng(seed)
+    game.bacteria = []
+    game.add_bacteria()
+
+
+def capture(game):
+    return (np.copy(game.map_state), game.bacteria[:], game.amoeba_size, game.rng.bit_generator.state,
+            copy.deepcopy(game.zobrist))
+
+
+def restore(game, state):
+    map_state, bacteria, amoeba_size, rng_state, zobrist = state
+    game.map_state = np.copy(map_state)
+    game.bacteria = bacteria[:]
+    game.amoeba_size = amoeba_size
+    game.rng.bit_generator.state = rng_state
+    game.zobrist = copy.deepcopy(zobrist)
+
+
+def bench_move(game, metabolism):
+    """A move of up to ceil(metabolism * size) cells that passes the periphery and movable checks of check_move
+
+        Retracts are taken from the bottom half of the periphery and extends from the free cells next to the rest
+        of it, so that check_move always gets to its connectivity test. The move is as large as the periphery
+        allows.
+    """
+    periphery, _, _, _ = game.get_periphery_info(False)
+    count = min(math.ceil(metabolism * game.amoeba_size), len(periphery) // 2)
+    retracts = sorted(periphery, key=lambda cell: (-cell[0], cell[1]))[:count]
+    extends = set()
+    for x, y in set(periphery).difference(retracts):
+        extends.update(game.find_neighbor(x, y, 0))
+    count = min(len(retracts), len(extends))
+    return retracts[:count], sorted(extends)[:count], periphery
+
+
+def time_calls(call, setup, repeat, warmup=0):
+    """Seconds taken by each of repeat calls of call, after warmup untimed ones that fill the caches, setup runs
+    untimed before every call"""
+    timings = []
+    for i in range(warmup + repeat):
+        setup()
+        start = time.perf_counter()
+        call()
+        if i >= warmup:
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(timings):
+    timings = np.sort(np.array(timings) * 1000)
+    trim = int(len(timings) * TRIM)
+    return {
+        "calls": len(timings),
+        "min_ms": round(float(timings.min()), 4),
+        "trimmed_ms": round(float(timings[trim:len(timings) - trim].mean()), 4),
+        "p50_ms": round(float(np.percentile(timings, 50)), 4),
+        "p90_ms": round(float(np.percentile(timings, 90)), 4),
+        "p99_ms": round(float(np.percentile(timings, 99)), 4),
+        "mean_ms": round(float(timings.mean()), 4),
+    }
+
+
+def case_name(operation, cells, density, metabolism=None):
+    name = "{}/cells={}/d={}".format(operation, cells, density)
+    if metabolism is not None:
+        name += "/m={}".format(metabolism)
+    return name
+
+
+def run_suite(size, multiples, densities, metabolisms, repeat, seed, operations=OPERATIONS, warmup=0, rounds=1):
+    """Times every operation on every board of the grid
+
+        The grid is timed rounds times over and the calls of every round are pooled per case, so that a stretch
+        of time the machine runs slower, which would take out every call of the cases timed during it, is spread
+        over all cases as a few slower calls each.
+
+        Args:
+            size (int): side of the initial amoeba square, boards hold size**2 times each multiple cells
+            multiples (List[float]): amoeba sizes relative to the initial size, 4 is the goal size
+            densities (List[float]): bacteria densities
+            metabolisms (List[float]): metabolisms, only check_move and amoeba_move depend on them
+            repeat (int): timed calls per case and round
+            seed (int): seed of the boards and of the rng the engine draws from
+            operations (List[str]): operations to time
+            warmup (int): untimed calls per case and round before the timed ones
+            rounds (int): passes over the grid
+        Returns:
+            dict: per case latency summary, keyed by case_name
+    """
+    timings = {}
+
+    def record(name, call, setup):
+        timings.setdefault(name, []).extend(time_calls(call, setup, repeat, warmup))
+
+    for _ in range(rounds):
+        for density in densities:
+            game = bench_game(size, density, seed)
+            if "initialize" in operations:
+                def reset_board():
+                    game.map_state = np.zeros((constants.map_dim, constants.map_dim), dtype=int)
+                    game.amoeba_size = size ** 2
+                    game.rng = np.random.default_rng(seed)
+                record(case_name("initialize", size ** 2, density), lambda: game.initialize(size), reset_board)
+
+            for multiple in multiples:
+                cells = int(round(size ** 2 * multiple))
+                set_amoeba(game, cells, seed)
+                board = capture(game)
+                reset = lambda: restore(game, board)
+
+                if "bacteria_move" in operations:
+                    record(case_name("bacteria_move", cells, density), game.bacteria_move, reset)
+                if "get_periphery_info" in operations:
+                    record(case_name("get_periphery_info", cells, density), lambda: game.get_periphery_info(True),
+                           reset)
+                if "add_bacteria" in operations:
+                    # eat the reachable bacteria first, so that add_bacteria has as many to replace as after a turn
+                    def eat():
+                        reset()
+                        game.eat_bacteria(game.get_periphery_info(False)[1])
+                    record(case_name("add_bacteria", cells, density), game.add_bacteria, eat)
+
+                for metabolism in metabolisms:
+                    game.metabolism = metabolism
+                    reset()
+                    retracts, extends, periphery = bench_move(game, metabolism)
+                    if "check_move" in operations:
+                        record(case_name("check_move", cells, density, metabolism),
+                               lambda: game.check_move(retracts, extends, periphery), reset)
+                    if "amoeba_move" in operations:
+                        record(case_name("amoeba_move", cells, density, metabolism),
+                               lambda: game.amoeba_move(retracts, extends), reset)
+
+    return {name: summarize(case) for name, case in timings.items()}
+
+
+def scaling(results):
+    """Exponent of the median latency in the amoeba size per operation, density and metabolism
+
+        Fitted as the slope of log(p50) over log(cells), 1 means the cost grows linearly with the amoeba.
+    """
+    series = {}
+    for name, summary in results.items():
+        parts = name.split("/")
+        cells = int(parts[1].split("=")[1])
+        key = "/".join([parts[0]] + parts[2:])
+        series.setdefault(key, []).append((cells, summary["p50_ms"]))
+
+    exponents = {}
+    for key, points in series.items():
+        if len(points) < 2:
+            continue
+        cells, p50 = np.log(np.array(points)).T
+        exponents[key] = float(np.polyfit(cells, p50, 1)[0])
+    return exponents
+
+
+def machine_info():
+    return {"python": platform.python_version(), "numpy": np.__version__, "processor": platform.machine(),
+            "system": platform.platform(), "cpus": os.cpu_count()}
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, results, settings):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    baseline = {
+        "machine": machine_info(),
+        "settings": settings,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=1, sort_keys=True)
+
+
+def compare(results, baseline, tolerance, statistic="min_ms"):
+    """Ratio of the current to the baseline statistic per case found in both, and the cases slower than tolerance"""
+    ratios = {}
+    for name, summary in results.items():
+        if statistic in baseline["results"].get(name, {}):
+            ratios[name] = summary[statistic] / baseline["results"][name][statistic]
+    regressions = [name for name, ratio in ratios.items() if ratio > tolerance]
+    return ratios, regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", "-A", type=int, default=15, help="length of a side of the initial amoeba square")
+    parser.add_argument("--multiples", nargs="+", type=float, default=[1, 2, 4],
+                        help="Amoeba sizes to time, as multiples of the initial size")
+    parser.add_argument("--densities", "-d", nargs="+", type=float, default=[0.01, 0.1, 0.3, 0.5],
+                        help="Bacteria densities")
+    parser.add_argument("--metabolisms", "-m", nargs="+", type=float, default=[0.1, 1.0], help="Metabolism values")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=OPERATIONS, help="Operations to time")
+    parser.add_argument("--repeat", "-r", type=int, default=12, help="Timed calls per case and round")
+    parser.add_argument("--warmup", "-w", type=int, default=2,
+                        help="Untimed calls per case and round before the timed ones")
+    parser.add_argument("--rounds", type=int, default=5, help="Passes over the cases, their calls are pooled")
+    parser.add_argument("--seed", "-s", type=int, default=2, help="Seed of the benchmark boards")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file to compare against")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="Ratio to the baseline above which a case is reported as a regression")
+    parser.add_argument("--statistic", choices=STATISTICS, default="min_ms",
+                        help="Statistic of the timed calls compared to the baseline")
+    parser.add_argument("--out", "-o", default=None, help="Also write the full results to this json file")
+    args = parser.parse_args()
+
+    settings = {"size": args.size, "multiples": args.multiples, "densities": args.densities,
+                "metabolisms": args.metabolisms, "repeat": args.repeat, "warmup": args.warmup, "rounds": args.rounds,
+                "seed": args.seed}
+    results = run_suite(args.size, args.multiples, args.densities, args.metabolisms, args.repeat, args.seed,
+                        args.operations, args.warmup, args.rounds)
+
+    baseline = None
+    if not args.save and os.path.isfile(args.baseline):
+        baseline = load_baseline(args.baseline)
+    ratios, regressions = compare(results, baseline, args.tolerance, args.statistic) if baseline else ({}, [])
+
+    print("{:<44} {:>9} {:>10} {:>9} {:>9} {:>9}".format("Case", "min ms", "trimmed ms", "p50 ms", "p99 ms",
+                                                          "vs base"))
+    for name, summary in results.items():
+        ratio = "{:.2f}x".format(ratios[name]) if name in ratios else "-"
+        print("{:<44} {:>9.3f} {:>10.3f} {:>9.3f} {:>9.3f} {:>9}".format(
+            name, summary["min_ms"], summary["trimmed_ms"], summary["p50_ms"], summary["p99_ms"], ratio))
+
+    print("\n{:<44} {:>9}".format("Scaling in amoeba size", "exponent"))
+    for key, exponent in scaling(results).items():
+        print("{:<44} {:>9.2f}".format(key, exponent))
+
+    if baseline:
+        print("\nBaseline recorded on {}".format(baseline["machine"]))
+        if baseline["machine"] != machine_info():
+            print("Warning: this machine is {}, ratios to a baseline recorded elsewhere mix machine and code "
+                  "differences".format(machine_info()))
+        timing = [baseline["settings"].get(key, 0) for key in ("rounds", "repeat", "warmup")]
+        if timing != [args.rounds, args.repeat, args.warmup]:
+            print("Warning: baseline timed {} rounds of {} calls after {} warmup calls per case, this run {} rounds "
+                  "of {} after {}".format(*timing, args.rounds, args.repeat, args.warmup))
+        if ratios:
+            print("Geometric mean {} ratio to baseline: {:.2f}x".format(args.statistic, float(np.exp(np.mean(np.log(list(
+                ratios.values())))))))
+        for name in regressions:
+            print("Regression: {} is {:.2f}x the baseline".format(name, ratios[name]))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"settings": settings, "results": results, "ratios": ratios}, f, indent=1)
+    if args.save:
+        save_baseline(args.baseline, results, settings)
+        print("\nBaseline written to {}".format(args.baseline))
@@ -0,0 +1,370 @@
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import os
+from collections import deque
+
+import numpy as np
+
+import constants
+from amoeba_game import AmoebaGame
+from worker_pool import game_args
+
+# Action the shrinker puts in place of an action it tries to get rid of
+EMPTY_ACTION = ([], [], 0)
+
+
+def _neighbors(x, y):
+    return [(x, (y - 1) % constants.map_dim), (x, (y + 1) % constants.map_dim),
+            ((x - 1) % constants.map_dim, y), ((x + 1) % constants.map_dim, y)]
+
+
+def is_connected(occupied):
+    """Breadth first search over the occupied cells, linear in their number, True for an empty map"""
+    cells = np.argwhere(occupied)
+    if not len(cells):
+        return True
+
+    seen = np.zeros_like(occupied, dtype=bool)
+    start = tuple(cells[0].tolist())
+    seen[start] = True
+    queue = deque([start])
+    count = 1
+    while queue:
+        for n in _neighbors(*queue.popleft()):
+            if occupied[n] and not seen[n]:
+                seen[n] = True
+                count += 1
+                queue.append(n)
+    return count == len(cells)
+
+
+class LinearCheckMoveGame(AmoebaGame):
+    """Candidate engine whose check_move tests connectivity with a linear search instead of list lookups"""
+
+    def check_move(self, retract, move, periphery):
+        periphery = set(periphery)
+        if not set(retract).issubset(periphery):
+            return False
+
+        movable = set(retract)
+        for i, j in periphery.difference(retract):
+            movable.update(self.find_movable_neighbor(i, j))
+        if not set(move).issubset(movable):
+            return False
+
+        amoeba = self.map_state > 0
+        for i, j in retract:
+            amoeba[i][j] = False
+        for i, j in move:
+            amoeba[i][j] = True
+        return is_connected(amoeba)
+
+
+def load_engine(path):
+    """Engine class from a module:Class path, e.g. engine_diff:LinearCheckMoveGame"""
+    module, name = path.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def random_action(rng, percept, metabolism):
+    """An action built from the percept, about half of them plausible moves and the rest broken in one way
+
+        Plausible moves pair random periphery cells with random movable cells, so they are still rejected
+        whenever they would disconnect the amoeba or extend from a retracted cell only.
+    """
+    periphery = [tuple(map(int, cell)) for cell in percept.periphery]
+    movable = [tuple(map(int, cell)) for cell in percept.movable_cells]
+    cap = math.ceil(metabolism * percept.current_size)
+    count = int(rng.integers(0, min(cap, len(periphery), len(movable)) + 1))
+    retract = [periphery[i] for i in rng.choice(len(periphery), count, replace=False)]
+    move = [movable[i] for i in rng.choice(len(movable), count, replace=False)]
+    info = int(rng.integers(0, 256))
+
+    kind = rng.choice(["move"] * 8 + ["none", "list", "byte", "info_type", "duplicate", "lengths", "too_many",
+                                      "stray_cell"])
+    if kind == "none":
+        return None
+    if kind == "list":
+        return [retract, move, info]
+    if kind == "byte":
+        info = int(rng.choice([-1, 256]))
+    elif kind == "info_type":
+        info = str(info)
+    elif kind == "duplicate" and count:
+        retract.append(retract[0])
+        move.append(move[0])
+    elif kind == "lengths":
+        move = move[:-1] if count else movable[:1]
+    elif kind == "too_many":
+        retract = periphery[:cap + 1]
+        move = movable[:cap + 1]
+    elif kind == "stray_cell":
+        # most likely neither on the periphery nor movable
+        cell = tuple(int(c) for c in rng.integers(0, constants.map_dim, 2))
+        retract.append(cell)
+        move.append(cell)
+    return retract, move, info
+
+
+def encode_action(action):
+    if action is None:
+        return None
+    form = "tuple" if type(action) is tuple else "list"
+    retract, move, info = action
+    return {"form": form, "retract": [list(c) for c in retract], "move": [list(c) for c in move], "info": info}
+
+
+def decode_action(data):
+    if data is None:
+        return None
+    action = ([tuple(c) for c in data["retract"]], [tuple(c) for c in data["move"]], data["info"])
+    return action if data["form"] == "tuple" else list(action)
+
+
+class ScriptedPlayer:
+    def __init__(self, actions=None, rng=None, metabolism=1.0):
+        """Stands in for the player, replays actions and once they run out draws random ones if given an rng
+
+            Every action handed to the engine, replayed or drawn, is appended to played.
+        """
+        self.actions = list(actions or [])
+        self.rng = rng
+        self.metabolism = metabolism
+        self.played = []
+        self.percepts = []
+
+    def move(self, last_percept, current_percept, info):
+        self.percepts.append(current_percept)
+        if len(self.played) < len(self.actions):
+            action = self.actions[len(self.played)]
+        elif self.rng is not None:
+            action = random_action(self.rng, current_percept, self.metabolism)
+        else:
+            action = EMPTY_ACTION
+        self.played.append(action)
+        return action
+
+
+class DecisionLog:
+    def __init__(self, game):
+        """Records what check_action and check_move decide, by wrapping them on the game instance"""
+        self.decisions = []
+        check_action, check_move = game.check_action, game.check_move
+
+        def logged_check_action(action):
+            result = check_action(action)
+            self.decisions.append(("check_action", bool(result)))
+            return result
+
+        def logged_check_move(retract, move, periphery):
+            result = check_move(retract, move, periphery)
+            self.decisions.append(("check_move", bool(result)))
+            return result
+
+        game.check_action = logged_check_action
+        game.check_move = logged_check_move
+
+
+def new_game(engine, spec, player):
+    """Game of the engine class set up from spec with player in place of a real one, before its first turn"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return engine(game_args("d", spec["seed"], size=spec["size"], density=spec["density"],
+                                metabolism=spec["metabolism"], final=0),
+                      player_factory=lambda rng, logger, metabolism, goal_size, precomp_dir: player)
+
+
+def _cells(cells, ordered):
+    cells = [tuple(map(int, cell)) for cell in cells]
+    return cells if ordered else sorted(cells)
+
+
+def state_fields(game, player, log, ordered):
+    """Everything compared after a turn, cell lists sorted unless ordered"""
+    percept = player.percepts[-1]
+    after = game.after_last_move
+    return {
+        "decisions": log.decisions[:],
+        "map_state": game.map_state.tolist(),
+        "bacteria": [tuple(map(int, cell)) for cell in game.bacteria],
+        "amoeba_size": int(game.amoeba_size),
+        "player_byte": game.player_byte,
+        "hashes": [player.percepts[-1].hashes, game.after_last_move.hashes],
+        # hashes the engine keeps incrementally that no longer match the board, equal hashes could drift alike
+        "hash_drift": game.zobrist.verify(game.map_state),
+        "periphery": _cells(percept.periphery, ordered),
+        "eatable_bacteria": _cells(percept.bacteria, ordered),
+        "movable_cells": _cells(percept.movable_cells, ordered),
+        "after_periphery": _cells(after.periphery, ordered),
+        "after_movable_cells": _cells(after.movable_cells, ordered),
+    }
+
+
+def _summary(value):
+    text = str(value)
+    return text if len(text) <= 200 else text[:200] + "..."
+
+
+def run_pair(candidate, spec, actions=None, turns=None, action_seed=None, ordered=False, reference=AmoebaGame):
+    """Plays the reference and the candidate engine in lockstep on the same actions
+
+        Actions are replayed from actions, or drawn from the reference percept with an rng seeded by action_seed,
+        and fed to both engines. Stops at the first turn where any compared field differs.
+
+        Returns:
+            Tuple[dict, list]: the mismatch (turn, field, reference and candidate values) or None, and the actions
+                played up to and including the mismatching turn
+    """
+    turns = len(actions) if turns is None else turns
+    ref_player = ScriptedPlayer(actions, None if action_seed is None else np.random.default_rng(action_seed),
+                                spec["metabolism"])
+    ref_game = new_game(reference, spec, ref_player)
+    # replays whatever the reference player hands out, on the same turn
+    cand_player = ScriptedPlayer()
+    cand_player.actions = ref_player.played
+    cand_game = new_game(candidate, spec, cand_player)
+    ref_log, cand_log = DecisionLog(ref_game), DecisionLog(cand_game)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for turn in range(1, turns + 1):
+            for game, player, log in ((ref_game, ref_player, ref_log), (cand_game, cand_player, cand_log)):
+                log.decisions.clear()
+                game.turns += 1
+                try:
+                    game.play_turn()
+                except Exception as e:
+                    log.decisions.append(("raised", repr(e)))
+
+            ref_fields = state_fields(ref_game, ref_player, ref_log, ordered)
+            cand_fields = state_fields(cand_game, cand_player, cand_log, ordered)
+            for field in ref_fields:
+                if ref_fields[field] != cand_fields[field]:
+                    mismatch = {"turn": turn, "field": field, "reference": _summary(ref_fields[field]),
+                                "candidate": _summary(cand_fields[field])}
+                    return mismatch, ref_player.played[:]
+
+    return None, ref_player.played[:]
+
+
+def _pairs(action):
+    """Number of (retract, move) pairs the shrinker can drop from an action, 0 if it isn't a pair of lists"""
+    if not isinstance(action, (tuple, list)) or len(action) != 3:
+        return 0
+    retract, move, _ = action
+    if not isinstance(retract, list) or not isinstance(move, list):
+        return 0
+    return max(len(retract), len(move))
+
+
+def _without(action, start, stop):
+    retract, move, info = action
+    smaller = (retract[:start] + retract[stop:], move[:start] + move[stop:], info)
+    return smaller if type(action) is tuple else list(smaller)
+
+
+def shrink(candidate, spec, actions, ordered=False, reference=AmoebaGame):
+    """Reduces a mismatching run to a smaller one that still mismatches
+
+        Tries, keeping every step that still fails: cutting the turns after the mismatch, dropping whole turns,
+        emptying actions, dropping halves down to single pairs of cells from the remaining actions and finally
+        lowering the density and the size of the board.
+
+        Returns:
+            Tuple[dict, list, dict]: the reduced spec, actions and their mismatch
+    """
+    def fails(spec, actions):
+        mismatch, _ = run_pair(candidate, spec, actions, ordered=ordered, reference=reference)
+        return mismatch
+
+    mismatch = fails(spec, actions)
+    if mismatch is None:
+        raise ValueError("The run to shrink does not mismatch")
+    actions = actions[:mismatch["turn"]]
+
+    for i in reversed(range(len(actions))):
+        for smaller in (actions[:i] + actions[i + 1:], actions[:i] + [EMPTY_ACTION] + actions[i + 1:]):
+            if smaller != actions and len(smaller) and fails(spec, smaller):
+                actions = smaller
+                break
+
+    for i in range(len(actions)):
+        chunk = _pairs(actions[i])
+        while chunk >= 1:
+            start = 0
+            while start < _pairs(actions[i]):
+                smaller = actions[:i] + [_without(actions[i], start, start + chunk)] + actions[i + 1:]
+                if fails(spec, smaller):
+                    actions = smaller
+                else:
+                    start += chunk
+            chunk //= 2
+
+    for key, values in (("density", [0.0, 0.01, 0.05, 0.1]), ("size", range(3, spec["size"]))):
+        for value in values:
+            if value >= spec[key]:
+                break
+            smaller = dict(spec, **{key: value})
+            if fails(smaller, actions):
+                spec = smaller
+                break
+
+    return spec, actions, fails(spec, actions)
+
+
+def random_spec(rng):
+    return {"seed": int(rng.integers(1, 2 ** 31)), "size": int(rng.integers(3, 21)),
+            "density": float(rng.choice([0.0, 0.01, 0.05, 0.1, 0.3, 0.5])),
+            "metabolism": float(rng.choice([0.05, 0.1, 0.5, 1.0]))}
+
+
+def save_reproducer(path, candidate_path, spec, actions, mismatch):
+    with open(path, "w") as f:
+        json.dump({"candidate": candidate_path, "spec": spec, "actions": [encode_action(a) for a in actions],
+                   "mismatch": mismatch}, f, indent=1)
+
+
+def load_reproducer(path):
+    with open(path) as f:
+        data = json.load(f)
+    return data["candidate"], data["spec"], [decode_action(a) for a in data["actions"]]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidate", "-c", default="engine_diff:LinearCheckMoveGame",
+                        help="Engine to check against AmoebaGame, as module:Class")
+    parser.add_argument("--runs", "-n", type=int, default=50, help="Number of random boards")
+    parser.add_argument("--turns", "-t", type=int, default=30, help="Turns played on every board")
+    parser.add_argument("--seed", "-s", type=int, default=1, help="Seed of the boards and actions")
+    parser.add_argument("--ordered", action="store_true", help="Also compare the order of the cell lists")
+    parser.add_argument("--out", "-o", default="engine_diff_repro.json", help="File the shrunk reproducer of the "
+                                                                              "first mismatch is written to")
+    parser.add_argument("--replay", default=None, help="Replay a reproducer file instead of random runs")
+    args = parser.parse_args()
+
+    if args.replay:
+        candidate_path, spec, actions = load_reproducer(args.replay)
+        mismatch, _ = run_pair(load_engine(candidate_path), spec, actions, ordered=args.ordered)
+        print("Mismatch: {}".format(mismatch) if mismatch else "No mismatch, the engines agree on the reproducer")
+    else:
+        candidate = load_engine(args.candidate)
+        rng = np.random.default_rng(args.seed)
+        for run in range(args.runs):
+            spec = random_spec(rng)
+            mismatch, actions = run_pair(candidate, spec, turns=args.turns, action_seed=int(rng.integers(2 ** 31)),
+                                         ordered=args.ordered)
+            if mismatch is None:
+                print("[{}/{}] {} agree for {} turns".format(run + 1, args.runs, spec, args.turns))
+                continue
+
+            print("[{}/{}] {} mismatch on turn {} in {}".format(run + 1, args.runs, spec, mismatch["turn"],
+                                                                mismatch["field"]))
+            spec, actions, mismatch = shrink(candidate, spec, actions, args.ordered)
+            save_reproducer(args.out, args.candidate, spec, actions, mismatch)
+            print("Shrunk to {} turns on {}: {}".format(len(actions), spec, mismatch))
+            print("Reproducer written to {}".format(args.out))
+            break
+        else:
+            print("\nNo mismatch in {} runs".format(args.runs))
@@ -0,0 +1,161 @@
+import argparse
+import contextlib
+import multiprocessing as mp
+import os
+import time
+
+from amoeba_game import AmoebaGame
+from checkpoint import snapshot_game, load_checkpoint, load_player
+from player_host import load_player_class
+from worker_pool import game_args
+
+# Snapshot and game spec every branch starts from, set in each worker by the pool initializer
+_base = None
+
+
+class ForcedMove:
+    def __init__(self, player, action):
+        """Wraps a player so that its first move is replaced by a given action
+
+            Args:
+                player (Player): player that makes every later move
+                action (Tuple[List[Tuple[int, int]], List[Tuple[int, int]], int]): retract, move and info byte
+        """
+        self.player = player
+        self.action = action
+
+    def move(self, last_percept, current_percept, info):
+        if self.action is not None:
+            action, self.action = self.action, None
+            return action
+        return self.player.move(last_percept=last_percept, current_percept=current_percept, info=info)
+
+
+def fork_point(spec, turn):
+    """Plays the game described by spec up to turn and returns the base for fork_game
+
+        Args:
+            spec (dict): game_args keyword arguments of the game to fork
+            turn (int): turn after which the branches diverge
+    """
+    base_spec = dict(spec, final=turn)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = AmoebaGame(game_args(**base_spec))
+    if game.goal_reached:
+        raise ValueError("Goal size was reached on turn {}, before the fork at turn {}".format(game.game_end, turn))
+
+    return {"spec": dict(spec), "snapshot": snapshot_game(game)}
+
+
+def checkpoint_fork_point(spec, path):
+    """Same as fork_point but starting from a checkpoint written by a game played with spec"""
+    return {"spec": dict(spec), "snapshot": load_checkpoint(path)}
+
+
+def _set_base(base):
+    global _base
+    _base = base
+
+
+def _run_branch(branch):
+    spec = dict(_base["spec"])
+    spec.update({key: value for key, value in branch.items() if key in ("player_in", "metabolism", "density",
+                                                                         "final")})
+    snapshot = dict(_base["snapshot"])
+    player_data = snapshot.pop("player")
+    snapshot["player"] = player_data[:0]
+
+    def player_factory(rng, logger, metabolism, goal_size, precomp_dir):
+        unchanged = all(spec[key] == _base["spec"][key] for key in ("player_in", "metabolism"))
+        if unchanged and len(player_data):
+            player = load_player(player_data.tobytes(), rng, logger)
+        else:
+            player = load_player_class(spec["player_in"])(rng=rng, logger=logger, metabolism=metabolism,
+                                                          goal_size=goal_size, precomp_dir=precomp_dir)
+        if branch.get("move") is not None:
+            player = ForcedMove(player, branch["move"])
+        return player
+
+    start_time = time.time()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = AmoebaGame(game_args(**spec), player_factory=player_factory, snapshot=snapshot)
+
+    fork_turn, fork_size = _base["snapshot"]["counters"].tolist()[:2]
+    return {
+        "branch": branch.get("name", str(branch)),
+        "goal_reached": game.goal_reached,
+        "stalled": game.stalled,
+        "turns": game.game_end if game.goal_reached else game.turns,
+        "final_size": game.amoeba_size,
+        "growth": game.amoeba_size - fork_size,
+        "fork_turn": fork_turn,
+        "time": time.time() - start_time,
+    }
+
+
+def fork_game(base, branches, processes=None):
+    """Continues the base game once per branch in a process pool
+
+        The base snapshot reaches the workers through the pool initializer, so on platforms that fork it is
+        shared copy-on-write instead of being pickled for every branch.
+
+        Args:
+            base (dict): result of fork_point or checkpoint_fork_point
+            branches (List[dict]): per-branch overrides, any of player_in, metabolism, density, final, a name
+                and move, an action forced as the first move after the fork
+            processes (int): number of worker processes, defaults to the cpu count
+        Returns:
+            List[dict]: one outcome per branch, in the order of branches
+    """
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+    with ctx.Pool(processes, initializer=_set_base, initargs=(base,)) as pool:
+        return pool.map(_run_branch, branches)
+
+
+def parse_branch(text):
+    branch = {"name": text}
+    for item in text.split(","):
+        key, value = item.split("=")
+        if key == "player":
+            branch["player_in"] = value
+        elif key in ("metabolism", "density"):
+            branch[key] = float(value)
+        elif key == "final":
+            branch[key] = int(value)
+        else:
+            raise argparse.ArgumentTypeError("Unknown branch setting {}".format(key))
+    return branch
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--player", "-p", default="d", help="Player of the base game")
+    parser.add_argument("--seed", "-s", type=int, default=2, help="Seed of the base game")
+    parser.add_argument("--size", "-A", type=int, default=15, help="length of a side of the initial amoeba square")
+    parser.add_argument("--density", "-d", type=float, default=0.3, help="Density of bacteria on the map")
+    parser.add_argument("--metabolism", "-m", type=float, default=1.0, help="Metabolism of the base game")
+    parser.add_argument("--final", "-l", type=int, default=1000, help="the maximum number of days")
+    parser.add_argument("--turn", "-t", type=int, default=None, help="Turn at which the game is forked")
+    parser.add_argument("--checkpoint", default=None, help="Fork from this checkpoint of the base game instead of "
+                                                           "replaying it up to --turn")
+    parser.add_argument("--branch", "-b", type=parse_branch, action="append", required=True,
+                        help="Branch settings as comma separated key=value pairs of player, metabolism, density "
+                             "and final, e.g. player=4,metabolism=0.5")
+    parser.add_argument("--processes", "-j", type=int, default=None, help="Number of worker processes")
+    args = parser.parse_args()
+
+    spec = {"player_in": args.player, "seed": args.seed, "size": args.size, "density": args.density,
+            "metabolism": args.metabolism, "final": args.final}
+    if args.checkpoint:
+        base = checkpoint_fork_point(spec, args.checkpoint)
+    elif args.turn is None:
+        parser.error("either --turn or --checkpoint is required")
+    else:
+        base = fork_point(spec, args.turn)
+
+    outcomes = fork_game(base, args.branch, args.processes)
+    print("Forked at turn {}\n".format(outcomes[0]["fork_turn"]))
+    print("{:<40} {:>6} {:>6} {:>7} {:>8}".format("Branch", "Goal", "Turns", "Size", "Growth"))
+    for outcome in sorted(outcomes, key=lambda o: (not o["goal_reached"], o["turns"], -o["final_size"])):
+        print("{:<40} {:>6} {:>6} {:>7} {:>8}".format(outcome["branch"], str(outcome["goal_reached"]),
+                                                      outcome["turns"], outcome["final_size"], outcome["growth"]))
@@ -1,7 +1,11 @@
 import argparse
+import os
 from amoeba_game import AmoebaGame
+from player_trace import TRACE_DIR_ENV
+from stall import STALL_DEFAULTS
 
-if __name__ == '__main__':
+
+def get_parser():
     parser = argparse.ArgumentParser()
     parser.add_argument("--metabolism", "-m", type=float, default=1.0, help="Value between 0 and 1 (including 1) that "
                                                                             "indicates what proportion of the amoeba "
@@ -15,19 +19,54 @@ if __name__ == '__main__':
                                                                   "each launch")
     parser.add_argument("--port", type=int, default=8080, help="Port to start, specify -1 to auto-assign")
     parser.add_argument("--address", "-a", type=str, default="127.0.0.1", help="Address")
-    parser.add_argument("--no_browser", "-nb", action="store_true", help="Disable browser launching in GUI mode")
+    parser.add_argument("--no_browser", "-nb", action="store_true", help="Disable browser launching in dashboard "
+                                                                         "mode")
+    parser.add_argument("--dashboard", action="store_true", help="Stream the game live to a web page served on "
+                                                                 "--address and --port")
     parser.add_argument("--no_gui", "-ng", action="store_true", help="Disable GUI")
     parser.add_argument("--log_path", default="log", help="Directory path to dump log files, filepath if "
                                                           "disable_logging is false")
     parser.add_argument("--disable_logging", action="store_true", help="Disable Logging, log_path becomes path to file")
+    parser.add_argument("--trace_dir", default=None, help="Directory players that support tracing write per-turn "
+                                                          "npz snapshots of their state to")
     parser.add_argument("--disable_timeout", action="store_true", help="Disable timeouts for player code")
+    parser.add_argument("--sandbox", action="store_true", help="Run the player in its own process, sharing the board "
+                                                               "state through shared memory")
+    parser.add_argument("--checkpoint_every", type=int, default=0, help="Save a checkpoint every n turns, 0 disables "
+                                                                         "checkpointing")
+    parser.add_argument("--checkpoint_path", default=os.path.join("checkpoints", "game.npz"),
+                        help="File the latest checkpoint is written to")
+    parser.add_argument("--resume", default=None, help="Checkpoint file to resume the game from")
+    parser.add_argument("--stall_detection", action="store_true", help="End the game as stalled once the goal "
+                                                                        "size is out of reach")
+    parser.add_argument("--stall_window", type=int, default=STALL_DEFAULTS["window"],
+                        help="Turns the growth rate is measured over for stall detection")
+    parser.add_argument("--stall_confidence", type=float, default=STALL_DEFAULTS["confidence"],
+                        help="Confidence of the growth rate bound used for stall detection")
+    parser.add_argument("--stall_idle_turns", type=int, default=STALL_DEFAULTS["idle_turns"],
+                        help="Consecutive invalid or empty moves after which a player counts as stuck")
+    parser.add_argument("--stall_repeat_turns", type=int, default=STALL_DEFAULTS["repeat_turns"],
+                        help="Consecutive turns on already seen amoeba shapes after which a player counts as stuck")
+    parser.add_argument("--stall_flat_turns", type=int, default=STALL_DEFAULTS["flat_turns"],
+                        help="Turns without growth after which a player counts as stuck")
+    parser.add_argument("--check_hashes", action="store_true", help="Recompute the board hashes from scratch after "
+                                                                    "every turn and stop on any drift of the "
+                                                                    "incremental ones")
     parser.add_argument("--player", "-p", default="d", help="Specifying player")
     parser.add_argument("--vid_name", "-v", default="game", help="Naming the video file")
     parser.add_argument("--no_vid", "-nv", action="store_true", help="Stops generating video of the session")
+    return parser
+
+
+if __name__ == '__main__':
+    parser = get_parser()
     args = parser.parse_args()
 
     if args.disable_logging:
         if args.log_path == "log":
             args.log_path = "results.log"
 
+    if args.trace_dir:
+        os.environ[TRACE_DIR_ENV] = args.trace_dir
+
     amoeba_game = AmoebaGame(args)
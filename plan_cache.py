@@ -0,0 +1,118 @@
+from collections import OrderedDict
+
+import numpy as np
+
+import constants
+from zobrist import NORMALISED_KEYS, normalising_shift
+
+# Plans a player keeps per game, least recently used ones are evicted first
+PLAN_CACHE_SIZE = 1024
+
+_FLAT_KEYS = NORMALISED_KEYS.ravel()
+
+
+def _map_codes(cell_map, shift):
+    """Sorted flat indices of the non zero cells of cell_map once rolled by shift"""
+    return np.flatnonzero(np.roll(cell_map != 0, shift, axis=(0, 1)))
+
+
+def _cell_codes(cells, shift):
+    """Flat indices of the cells once translated by shift, in the order given"""
+    cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    x = (cells[:, 0] + shift[0]) % constants.map_dim
+    y = (cells[:, 1] + shift[1]) % constants.map_dim
+    return x * constants.map_dim + y
+
+
+def _code_hash(codes):
+    codes = np.unique(codes)
+    return int(np.bitwise_xor.reduce(_FLAT_KEYS[codes])) if len(codes) else 0
+
+
+def _code_cells(codes, shift):
+    """Cells of the flat indices, translated back by shift"""
+    x, y = np.divmod(codes, constants.map_dim)
+    return list(zip(((x - shift[0]) % constants.map_dim).tolist(), ((y - shift[1]) % constants.map_dim).tolist()))
+
+
+def is_valid_plan(retracts, extends, periphery, movable, budget):
+    """Cheap recheck of a plan against the percept it is returned for, connectivity is left to the planner"""
+    if len(retracts) != len(extends) or len(extends) > budget:
+        return False
+    if not set(periphery).issuperset(retracts):
+        return False
+    return set(movable).union(retracts).issuperset(extends)
+
+
+class MovePlanner:
+    def __init__(self, name, max_size=PLAN_CACHE_SIZE):
+        """Translation invariant LRU cache of a player's move plans, with hit statistics for the current game
+
+            Formation players march the same shape towards the same relative target over and over, so the same
+            planning problem recurs at many positions of the torus. Plans are keyed by the planner name, the move
+            budget and the Zobrist hashes of the amoeba, target, periphery, movable cells and bacteria, all taken
+            in the frame zobrist.normalising_shift anchors the amoeba in. They are stored in that frame and
+            translated back to the amoeba's position when reused, then rechecked against the percept. Plans are
+            still computed where the amoeba is, so a game only departs from an uncached one when a plan is reused
+            at another position.
+
+            The cache lives with the player, so a game never depends on what other games of the process planned.
+
+            Args:
+                name (str): name of the planner, used in the keys
+                max_size (int): number of plans kept
+        """
+        self.name = name
+        self.max_size = max_size
+        self.plans = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+
+    def plan(self, compute, amoeba_map, target, periphery, movable, bacteria, budget):
+        """Retracts and extends compute returns for the given problem, from the cache when it has them
+
+            Args:
+                compute (Callable): planner taking (amoeba_map, target, periphery, movable, bacteria, budget) and
+                    returning the (retracts, extends) lists
+                amoeba_map (numpy array): map of the amoeba, non zero cells are amoeba
+                target (numpy array): map of the formation to morph to, non zero cells are part of it
+                periphery (List[Tuple[int, int]]): retractable cells
+                movable (List[Tuple[int, int]]): extendable cells
+                bacteria (List[Tuple[int, int]]): bacteria known to the amoeba
+                budget (int): number of cells allowed to move
+            Returns:
+                Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]: retracts and extends
+        """
+        shift = normalising_shift(amoeba_map != 0)
+        key = (self.name, int(budget), _code_hash(_map_codes(amoeba_map, shift)),
+               _code_hash(_map_codes(target, shift)),
+               *[_code_hash(_cell_codes(cells, shift)) for cells in (periphery, movable, bacteria)])
+
+        plan = self.plans.get(key)
+        if plan is not None:
+            retracts, extends = _code_cells(plan[0], shift), _code_cells(plan[1], shift)
+            if is_valid_plan(retracts, extends, periphery, movable, budget):
+                self.plans.move_to_end(key)
+                self.hits += 1
+                return retracts, extends
+            self.rejected += 1
+        self.misses += 1
+
+        retracts, extends = compute(amoeba_map, target, periphery, movable, bacteria, budget)
+        self.plans[key] = (_cell_codes(retracts, shift), _cell_codes(extends, shift))
+        self.plans.move_to_end(key)
+        if len(self.plans) > self.max_size:
+            self.plans.popitem(last=False)
+        return retracts, extends
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "lookups": lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "cached": len(self.plans),
+        }
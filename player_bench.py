@@ -0,0 +1,250 @@
+import argparse
+import contextlib
+import copy
+import glob
+import json
+import logging
+import os
+import time
+import tracemalloc
+
+import numpy as np
+
+import constants
+from amoeba_game import AmoebaGame
+from amoeba_state import AmoebaState
+from player_host import load_player_class, player_display_name
+from worker_pool import game_args
+
+FIXTURE_DIR = os.path.join("benchmarks", "fixtures")
+
+# Board states of the corpus and the games they are taken from, either at a given turn or at the first turn the
+# amoeba shows the named shape
+FIXTURES = [
+    {"name": "initial_square", "player_in": "d", "seed": 2, "turn": 1},
+    {"name": "comb_half_formed", "player_in": "2", "seed": 2, "turn": 12},
+    {"name": "comb_translating", "player_in": "2", "seed": 2, "turn": 60},
+    {"name": "rake_full", "player_in": "7", "seed": 2, "turn": 120},
+    {"name": "wrapped", "player_in": "2", "seed": 2, "density": 0.05, "shape": "wrapped"},
+    {"name": "split", "player_in": "8", "seed": 2, "shape": "split"},
+    {"name": "bacteria_dense", "player_in": "4", "seed": 4, "density": 0.5, "turn": 20},
+    {"name": "bacteria_sparse", "player_in": "4", "seed": 4, "density": 0.01, "turn": 30},
+]
+
+
+def _runs(occupied):
+    """Number of runs of consecutive occupied lines, not counting the wrap around the map edge"""
+    return int(occupied[0]) + int(np.count_nonzero(occupied[1:] & ~occupied[:-1]))
+
+
+def shape_of(amoeba_map):
+    """wrapped if the amoeba crosses the edge of the first map axis, split if it crosses the edge of the second,
+    which leaves its occupied columns in more than one run"""
+    occupied = amoeba_map != 0
+    if _runs(occupied.any(axis=0)) > 1:
+        return "split"
+    if _runs(occupied.any(axis=1)) > 1:
+        return "wrapped"
+    return None
+
+
+def _coords(cells):
+    return np.array(cells, dtype=np.uint8).reshape(-1, 2)
+
+
+def _cells(coords):
+    return list(map(tuple, coords.tolist()))
+
+
+def pack_state(state, prefix):
+    return {
+        prefix + "size": np.array(state.current_size),
+        prefix + "map": np.packbits(np.asarray(state.amoeba_map) != 0),
+        prefix + "periphery": _coords(state.periphery),
+        prefix + "bacteria": _coords(state.bacteria),
+        prefix + "movable_cells": _coords(state.movable_cells),
+    }
+
+
+def unpack_state(data, prefix):
+    amoeba_map = np.unpackbits(data[prefix + "map"])[:constants.total_cells]
+    return AmoebaState(int(data[prefix + "size"]), amoeba_map.reshape(constants.map_dim, constants.map_dim).astype(int),
+                       _cells(data[prefix + "periphery"]), _cells(data[prefix + "bacteria"]),
+                       _cells(data[prefix + "movable_cells"]))
+
+
+def save_fixture(path, meta, last_percept, current_percept, info):
+    """Stores the arguments of one move call, maps as bit arrays and cell lists as uint8 coordinate tables"""
+    arrays = {"meta": np.array(json.dumps(meta)), "info": np.array(info)}
+    arrays.update(pack_state(last_percept, "last_"))
+    arrays.update(pack_state(current_percept, "current_"))
+    np.savez_compressed(path, **arrays)
+
+
+def load_fixture(path):
+    """Returns the metadata and the last_percept, current_percept and info arguments of a stored fixture"""
+    with np.load(path) as data:
+        return (json.loads(str(data["meta"])), unpack_state(data, "last_"), unpack_state(data, "current_"),
+                int(data["info"]))
+
+
+class _Captured(Exception):
+    pass
+
+
+class RecordingPlayer:
+    def __init__(self, player, fixture):
+        """Wraps a player and captures the arguments of the move call the fixture asks for
+
+            The game is stopped by raising _Captured as soon as the fixture is captured.
+        """
+        self.player = player
+        self.fixture = fixture
+        self.turn = 0
+        self.captured = None
+
+    def move(self, last_percept, current_percept, info):
+        self.turn += 1
+        if "turn" in self.fixture:
+            capture = self.turn == self.fixture["turn"]
+        else:
+            capture = shape_of(current_percept.amoeba_map) == self.fixture["shape"]
+        if capture:
+            self.captured = copy.deepcopy((last_percept, current_percept, info))
+            raise _Captured()
+        return self.player.move(last_percept=last_percept, current_percept=current_percept, info=info)
+
+
+def generate_fixture(fixture, fixture_dir=FIXTURE_DIR, max_turns=1000):
+    """Plays the game of a FIXTURES entry up to the board it describes and stores it, returns the path or None if
+    the game never reached it"""
+    spec = {"player_in": fixture["player_in"], "seed": fixture["seed"], "size": fixture.get("size", 15),
+            "density": fixture.get("density", 0.3), "metabolism": fixture.get("metabolism", 1.0),
+            "final": fixture.get("turn", max_turns)}
+    recorders = []
+
+    def player_factory(rng, logger, metabolism, goal_size, precomp_dir):
+        player = load_player_class(spec["player_in"])(rng=rng, logger=logger, metabolism=metabolism,
+                                                      goal_size=goal_size, precomp_dir=precomp_dir)
+        recorders.append(RecordingPlayer(player, fixture))
+        return recorders[-1]
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            AmoebaGame(game_args(**spec), player_factory=player_factory)
+        except _Captured:
+            pass
+    if recorders[0].captured is None:
+        return None
+
+    os.makedirs(fixture_dir, exist_ok=True)
+    meta = dict(spec, name=fixture["name"], turn=recorders[0].turn, goal_size=4 * spec["size"] ** 2)
+    del meta["final"]
+    path = os.path.join(fixture_dir, "{}.npz".format(fixture["name"]))
+    save_fixture(path, meta, *recorders[0].captured)
+    return path
+
+
+def load_corpus(fixture_dir=FIXTURE_DIR):
+    return [load_fixture(path) for path in sorted(glob.glob(os.path.join(fixture_dir, "*.npz")))]
+
+
+def bench_player(player_in, corpus, repeat, precomp_root="precomp"):
+    """Times player_in's move on every fixture of the corpus
+
+        The player is constructed once per fixture, untimed, and every timed call gets a fresh copy of it and of
+        the percepts so that state left behind by one call never feeds the next. The stored info byte is only
+        passed to the player the fixture was recorded with, other players get 0 as on their first turn.
+        Allocations are measured in a separate traced call, as tracing slows the calls down.
+
+        Returns:
+            List[dict]: one latency and allocation summary per fixture
+    """
+    player_class = load_player_class(player_in)
+    logger = logging.getLogger("player_bench.{}".format(player_display_name(player_in)))
+    logger.disabled = True
+    precomp_dir = os.path.join(precomp_root, player_display_name(player_in))
+    os.makedirs(precomp_dir, exist_ok=True)
+
+    rows = []
+    for meta, last_percept, current_percept, info in corpus:
+        rng = np.random.default_rng(meta["seed"])
+        row = {"player": player_display_name(player_in), "fixture": meta["name"]}
+        player_info = info if meta["player_in"] == player_in else 0
+        try:
+            player = player_class(rng=rng, logger=logger, metabolism=meta["metabolism"],
+                                  goal_size=meta["goal_size"], precomp_dir=precomp_dir)
+            memo = {id(rng): rng, id(logger): logger}
+            rng_state = rng.bit_generator.state
+
+            def call(trace=False):
+                move_player = copy.deepcopy(player, dict(memo))
+                args = copy.deepcopy((last_percept, current_percept))
+                rng.bit_generator.state = rng_state
+                if trace:
+                    tracemalloc.start()
+                start = time.perf_counter()
+                move_player.move(last_percept=args[0], current_percept=args[1], info=player_info)
+                elapsed = time.perf_counter() - start
+                if trace:
+                    memory = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    return memory
+                return elapsed
+
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                timings = np.array([call() for _ in range(repeat)]) * 1000
+                allocated, peak = call(trace=True)
+        except Exception as e:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            row["error"] = repr(e)
+            rows.append(row)
+            continue
+
+        row.update({
+            "calls": repeat,
+            "p50_ms": round(float(np.percentile(timings, 50)), 4),
+            "p95_ms": round(float(np.percentile(timings, 95)), 4),
+            "p99_ms": round(float(np.percentile(timings, 99)), 4),
+            "peak_kb": round(peak / 1024, 1),
+            "retained_kb": round(allocated / 1024, 1),
+        })
+        rows.append(row)
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", "-p", nargs="+", default=["d"] + [str(i) for i in range(1, 9)],
+                        help="Players to benchmark")
+    parser.add_argument("--fixtures", "-f", nargs="+", default=None, help="Fixture names to run, defaults to all")
+    parser.add_argument("--fixture_dir", default=FIXTURE_DIR, help="Directory of the fixture corpus")
+    parser.add_argument("--generate", action="store_true", help="Regenerate the fixture corpus from FIXTURES")
+    parser.add_argument("--repeat", "-r", type=int, default=10, help="Timed calls per player and fixture")
+    parser.add_argument("--out", "-o", default=None, help="Also write the results to this file, one json per line")
+    args = parser.parse_args()
+
+    if args.generate:
+        for fixture in FIXTURES:
+            path = generate_fixture(fixture, args.fixture_dir)
+            print("{:<20} {}".format(fixture["name"], path or "not reached"))
+
+    corpus = [entry for entry in load_corpus(args.fixture_dir)
+              if args.fixtures is None or entry[0]["name"] in args.fixtures]
+    rows = []
+    print("\n{:<16} {:<20} {:>9} {:>9} {:>9} {:>10}".format("Player", "Fixture", "p50 ms", "p95 ms", "p99 ms",
+                                                           "peak KB"))
+    for player_in in args.players:
+        for row in bench_player(player_in, corpus, args.repeat):
+            rows.append(row)
+            if "error" in row:
+                print("{:<16} {:<20} {}".format(row["player"], row["fixture"], row["error"]))
+            else:
+                print("{:<16} {:<20} {:>9.3f} {:>9.3f} {:>9.3f} {:>10.1f}".format(
+                    row["player"], row["fixture"], row["p50_ms"], row["p95_ms"], row["p99_ms"], row["peak_kb"]))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
@@ -0,0 +1,225 @@
+import importlib
+import logging
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import constants
+from amoeba_state import AmoebaState
+
+# Layout of one percept slot inside the shared memory block: the 0/1 amoeba map as int8 followed by
+# three (total_cells, 2) int16 coordinate tables for periphery, bacteria and movable cells
+MAP_BYTES = constants.map_dim * constants.map_dim
+COORD_BYTES = constants.total_cells * 2 * 2
+SLOT_BYTES = MAP_BYTES + 3 * COORD_BYTES
+LAST_SLOT = 0
+CURRENT_SLOT = 1
+
+
+def player_module(player_in):
+    """Returns the module path holding the Player class for a player id from constants.possible_players"""
+    if player_in.lower() == 'd':
+        return "players.default_player"
+    return "players.g{}_player".format(player_in)
+
+
+def player_display_name(player_in):
+    if player_in.lower() == 'd':
+        return "Default Player"
+    return "Group {}".format(player_in)
+
+
+def load_player_class(player_in):
+    return importlib.import_module(player_module(player_in)).Player
+
+
+class PerceptBuffer:
+    def __init__(self, name=None):
+        """Two AmoebaState slots (last and current percept) laid out in a multiprocessing shared memory block
+
+            Args:
+                name (str): name of an existing block to attach to, a new block is created if None
+        """
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=2 * SLOT_BYTES)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self.shm.name
+
+        self.maps = []
+        self.coords = []
+        for slot in (LAST_SLOT, CURRENT_SLOT):
+            offset = slot * SLOT_BYTES
+            self.maps.append(np.ndarray((constants.map_dim, constants.map_dim), dtype=np.int8,
+                                        buffer=self.shm.buf, offset=offset))
+            self.coords.append([np.ndarray((constants.total_cells, 2), dtype=np.int16, buffer=self.shm.buf,
+                                           offset=offset + MAP_BYTES + k * COORD_BYTES) for k in range(3)])
+
+    def write(self, slot, state):
+        """Copies an AmoebaState into a slot and returns the small header needed to read it back
+
+            Returns:
+                Tuple[int, int, int, int, dict]: current size, the lengths of periphery, bacteria and movable cells
+                    and the state hashes
+        """
+        self.maps[slot][:] = state.amoeba_map
+        lengths = []
+        for table, cells in zip(self.coords[slot], (state.periphery, state.bacteria, state.movable_cells)):
+            if len(cells):
+                table[:len(cells)] = cells
+            lengths.append(len(cells))
+
+        return (state.current_size,) + tuple(lengths) + (state.hashes,)
+
+    def read(self, slot, header):
+        current_size, n_periphery, n_bacteria, n_movable, hashes = header
+        amoeba_map = self.maps[slot].astype(int)
+        periphery, bacteria, movable_cells = [list(map(tuple, table[:n].tolist())) for table, n in
+                                              zip(self.coords[slot], (n_periphery, n_bacteria, n_movable))]
+
+        return AmoebaState(current_size, amoeba_map, periphery, bacteria, movable_cells, hashes)
+
+    def close(self):
+        # views into the buffer have to be released before the block can be closed
+        self.maps = []
+        self.coords = []
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _host_main(conn, shm_name, player_in, seed, metabolism, goal_size, precomp_dir, log_path):
+    """Entry point of the player process, serves move requests until it is told to close"""
+    logger = logging.getLogger("amoeba_game.{}".format(player_display_name(player_in)))
+    if log_path:
+        logger.setLevel(logging.INFO)
+        fh = logging.FileHandler(log_path, mode="a")
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(fh)
+    else:
+        logger.setLevel(logging.ERROR)
+        logger.disabled = True
+
+    buffer = PerceptBuffer(shm_name)
+    try:
+        player = load_player_class(player_in)(rng=np.random.default_rng(seed), logger=logger,
+                                              metabolism=metabolism, goal_size=goal_size, precomp_dir=precomp_dir)
+    except Exception as e:
+        conn.send(("error", repr(e)))
+        buffer.close()
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message[0] == "close":
+            break
+
+        _, last_header, current_header, info = message
+        try:
+            action = player.move(last_percept=buffer.read(LAST_SLOT, last_header),
+                                 current_percept=buffer.read(CURRENT_SLOT, current_header), info=info)
+            conn.send(("ok", action))
+        except Exception as e:
+            conn.send(("error", repr(e)))
+
+    buffer.close()
+    conn.close()
+
+
+class PlayerHost:
+    def __init__(self, player_in, seed, logger, metabolism, goal_size, precomp_dir, log_path=None,
+                 move_timeout=None):
+        """Runs a player in its own process and exposes the same move() interface as an in-process player
+
+            The board state of both percepts is published in shared memory, only the headers and the returned
+            action cross the pipe. The hosted player draws from its own generator seeded with seed, so players
+            that use their rng will not reproduce the draws of an in-process run.
+
+            Args:
+                player_in (str): player id, one of constants.possible_players
+                seed (int): seed for the player's random number generator
+                logger (logging.Logger): engine logger, crashes and timeouts are reported here
+                metabolism (float): the percentage of amoeba cells, that can move
+                goal_size (int): the size the amoeba must reach
+                precomp_dir (str): Directory path to store/load pre-computation
+                log_path (str): file the player logger appends to, player logging is disabled if None
+                move_timeout (float): seconds allowed per move, the player process is killed once exceeded
+        """
+        self.player_in = player_in
+        self.logger = logger
+        self.move_timeout = move_timeout
+        self.alive = False
+
+        self.buffer = PerceptBuffer()
+        self.conn, child_conn = mp.Pipe()
+        self.process = mp.Process(target=_host_main, daemon=True,
+                                  args=(child_conn, self.buffer.name, player_in, seed, metabolism, goal_size,
+                                        precomp_dir, log_path))
+        self.process.start()
+        child_conn.close()
+
+        status, payload = self._receive(None)
+        if status == "ready":
+            self.alive = True
+        else:
+            self.logger.error("Player process {} failed to initialize: {}".format(player_in, payload))
+            self.close()
+
+    def _receive(self, timeout):
+        try:
+            if timeout is not None and not self.conn.poll(timeout):
+                return "timeout", None
+            return self.conn.recv()
+        except (EOFError, OSError) as e:
+            return "crash", repr(e)
+
+    def move(self, last_percept, current_percept, info):
+        if not self.alive:
+            return None
+
+        last_header = self.buffer.write(LAST_SLOT, last_percept)
+        current_header = self.buffer.write(CURRENT_SLOT, current_percept)
+        try:
+            self.conn.send(("move", last_header, current_header, info))
+        except (BrokenPipeError, OSError) as e:
+            self.logger.error("Player process {} is gone: {}".format(self.player_in, repr(e)))
+            self.close()
+            return None
+
+        status, payload = self._receive(self.move_timeout)
+        if status == "ok":
+            return payload
+        if status == "error":
+            self.logger.error("Player {} raised during move: {}".format(self.player_in, payload))
+            return None
+
+        if status == "timeout":
+            self.logger.error("Move timeout {} since {:.3f}s reached.".format(self.player_in, self.move_timeout))
+        else:
+            self.logger.error("Player process {} crashed: {}".format(self.player_in, payload))
+        self.close()
+        return None
+
+    def close(self):
+        if self.process is None:
+            return
+        if self.alive:
+            try:
+                self.conn.send(("close",))
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.alive = False
+        self.process = None
+        self.conn.close()
+        self.buffer.close()
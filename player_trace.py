@@ -0,0 +1,64 @@
+import logging
+import os
+
+import numpy as np
+
+# Environment variable naming the directory per-turn array snapshots are written to, read by PlayerTrace so that
+# players constructed by the engine, in a worker or in a sandbox process all pick it up without extra arguments
+TRACE_DIR_ENV = "AMOEBA_TRACE_DIR"
+
+
+def _evaluate(value):
+    return value() if callable(value) else value
+
+
+class PlayerTrace:
+    def __init__(self, logger, snapshot_dir=None):
+        """Debug tracing for players whose payloads are only built when something consumes them
+
+            Text goes to the player logger and is formatted only if the logger would emit it. Arrays recorded during
+            a turn are written as one compressed npz per turn, only if a snapshot directory is configured. Payloads
+            may be passed as zero-argument callables so that even computing them is skipped when tracing is off.
+
+            Args:
+                logger (logging.Logger): player logger
+                snapshot_dir (str): directory for the npz snapshots, defaults to $AMOEBA_TRACE_DIR/<player name>,
+                    snapshots are disabled if neither is set
+        """
+        self.logger = logger
+        if snapshot_dir is None and os.environ.get(TRACE_DIR_ENV):
+            snapshot_dir = os.path.join(os.environ[TRACE_DIR_ENV], logger.name.split(".")[-1])
+        self.snapshot_dir = snapshot_dir
+        self.turn = None
+        self.arrays = {}
+
+    @property
+    def text_enabled(self):
+        return self.logger.isEnabledFor(logging.INFO)
+
+    @property
+    def snapshots_enabled(self):
+        return bool(self.snapshot_dir)
+
+    def info(self, message, *args):
+        """logger.info(message, *args) where callable args are evaluated only if the message is emitted"""
+        if self.text_enabled:
+            self.logger.info(message, *[_evaluate(arg) for arg in args])
+
+    def begin_turn(self, turn):
+        self.turn = turn
+        self.arrays = {}
+
+    def record(self, **arrays):
+        """Adds arrays (or callables returning them) to the snapshot of the current turn"""
+        if not self.snapshots_enabled:
+            return
+        for name, value in arrays.items():
+            self.arrays[name] = np.asarray(_evaluate(value))
+
+    def end_turn(self):
+        """Writes the arrays recorded since begin_turn to <snapshot_dir>/turn_<turn>.npz"""
+        if self.snapshots_enabled and self.arrays:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            np.savez_compressed(os.path.join(self.snapshot_dir, "turn_{:04d}.npz".format(self.turn)), **self.arrays)
+        self.arrays = {}
@@ -8,9 +8,13 @@ from statistics import mode
 import numpy.typing as npt
 from typing import Tuple, List
 import time
+from plan_cache import MovePlanner
 
 MAP_DIM = 100
 
+# Part of the persisted template's file name, bump it whenever comb_offsets lays the comb out differently
+COMB_VERSION = 1
+
 def map_to_coords(amoeba_map: npt.NDArray) -> list[Tuple[int, int]]:
     return list(map(tuple, np.transpose(amoeba_map.nonzero()).tolist()))
 
@@ -20,6 +24,106 @@ def coords_to_map(coords: list[tuple[int, int]], size=MAP_DIM) -> npt.NDArray:
         amoeba_map[x, y] = 1
     return amoeba_map
 
+def cells_to_mask(cells, size=MAP_DIM) -> npt.NDArray:
+    mask = np.zeros((size, size), dtype=bool)
+    cells = np.asarray(cells, dtype=int).reshape(-1, 2)
+    mask[cells[:, 0], cells[:, 1]] = True
+    return mask
+
+
+def comb_offsets(cell_num: int, teeth_length: int, teeth_gap: int) -> npt.NDArray:
+    """Cells of the comb with its upper right corner at (0, 0), in the order they are laid out
+
+    The walk only ever moves relative to the previous cell, so the comb at any other corner is this one translated,
+    and the comb of a smaller amoeba is a prefix of it.
+    """
+    cell_num -= 1
+    cur_point_x = 0
+    cur_point_y = 0
+    formation = [(cur_point_x, cur_point_y)]
+    seen = {(cur_point_x, cur_point_y)}
+    length_left = teeth_length
+    gap = False
+    gap_left = teeth_gap
+    to_right = True
+
+    while cell_num > 0:
+        if gap == False:
+            # extending the teeth
+            if length_left > 0:
+                cur_point_x = (cur_point_x - 1) % MAP_DIM
+                formation.append((cur_point_x, cur_point_y))
+                seen.add((cur_point_x, cur_point_y))
+                length_left -= 1
+                cell_num -= 1
+            else:
+                #go down one extending the length of the comb
+                gap = True
+                cur_point_x = (cur_point_x + teeth_length) % MAP_DIM # restore the x-axis
+                length_left = teeth_length
+        else:
+            if gap_left > 0:
+                if to_right == False:
+                    cur_point_y = (cur_point_y - 1) % MAP_DIM
+                    cur_point_x = (cur_point_x + 1) % MAP_DIM # move the coordinate back
+                    formation.append((cur_point_x, cur_point_y))
+                    seen.add((cur_point_x, cur_point_y))
+                    gap_left -= 1
+                    cell_num -= 1
+                    to_right = True
+                else:
+                    cur_point_x = (cur_point_x - 1) % MAP_DIM # move the coordinate back
+                    if (cur_point_x, cur_point_y) not in seen:
+                        formation.append((cur_point_x, cur_point_y))
+                        seen.add((cur_point_x, cur_point_y))
+                        cell_num -= 1
+                    to_right = False
+            else:
+                to_right = True
+                gap = False
+                gap_left = teeth_gap
+
+    return np.array(formation, dtype=np.int16)
+
+
+class CombTemplates:
+    def __init__(self, teeth_length: int, teeth_gap: int, max_size: int, precomp_dir: str = None) -> None:
+        """Canonical comb for a (teeth_length, teeth_gap), from which the comb of every size is sliced
+
+            Args:
+                teeth_length (int): length of the comb teeth
+                teeth_gap (int): gap between two teeth
+                max_size (int): largest amoeba size the template is generated for up front
+                precomp_dir (str): directory the template is persisted in, nothing is stored if None
+        """
+        self.teeth_length = teeth_length
+        self.teeth_gap = teeth_gap
+        self.path = None
+        self.offsets = np.zeros((0, 2), dtype=np.int16)
+
+        if precomp_dir is not None:
+            self.path = os.path.join(precomp_dir, "comb_template_v{}_{}_{}_{}.npz".format(
+                COMB_VERSION, MAP_DIM, teeth_length, teeth_gap))
+            if os.path.isfile(self.path):
+                with np.load(self.path) as data:
+                    self.offsets = data["offsets"]
+        self.ensure(max_size)
+
+    def ensure(self, size: int) -> None:
+        if len(self.offsets) >= size:
+            return
+        self.offsets = comb_offsets(size, self.teeth_length, self.teeth_gap)
+        if self.path is not None:
+            tmp_path = "{}.{}.tmp.npz".format(self.path, os.getpid())
+            np.savez_compressed(tmp_path, offsets=self.offsets)
+            os.replace(tmp_path, self.path)
+
+    def get(self, cell_num: int, upper_right: (int, int)) -> npt.NDArray:
+        """(n, 2) array of the comb of cell_num cells with its upper right corner at upper_right"""
+        cell_num = max(cell_num, 1)
+        self.ensure(cell_num)
+        return (self.offsets[:cell_num] + np.array(upper_right)) % MAP_DIM
+
 
 
 class Player:
@@ -58,6 +162,9 @@ class Player:
         self.teeth_length = 1 # hyper parameter
         self.teeth_gap = 2 # hyper parameter
         self.acceptable_similarity = 0.8 # how similar the ideal format and the current shape should be before we start to move
+        self.combs = {(self.teeth_length, self.teeth_gap): CombTemplates(self.teeth_length, self.teeth_gap,
+                                                                         goal_size, precomp_dir)}
+        self.plans = MovePlanner("g1")
         logger.info(f"initalizing player 1, with initalize size :{ goal_size/4},teeth_length:{self.teeth_length}" )
     def move(self, last_percept, current_percept, info) -> (list, list, int):
         """Function which retrieves the current state of the amoeba map and returns an amoeba movement
@@ -132,7 +239,9 @@ class Player:
             
         # print(upper_right)
         moveable_cell_num = math.ceil(self.metabolism* current_size)
-        retract, extend = self.move_formation(moveable_cell_num, periphery, movable_location, comb_formation,current_size)
+        retract, extend = self.plans.plan(self.plan_formation_moves, current_percept.amoeba_map,
+                                          cells_to_mask(comb_formation), periphery, movable_location,
+                                          current_percept.bacteria, moveable_cell_num)
         """print("comb_formation=", comb_formation)
         
         print("movable_location=", movable_location)
@@ -145,76 +254,21 @@ class Player:
         return  retract, extend, info
 
     def movable (self, comb_formation,periphery):
-        periphery_set = {tuple(x) for x in periphery} 
-        comb_formation_set = {tuple(x) for x in comb_formation} 
-        over_lap = periphery_set & comb_formation_set ## what are the cells that are on point
-        if over_lap == comb_formation_set:
+        periphery_mask = cells_to_mask(periphery)
+        comb_formation_mask = cells_to_mask(comb_formation)
+        over_lap = periphery_mask & comb_formation_mask ## what are the cells that are on point
+        if not np.any(comb_formation_mask & ~over_lap):
             return True
         else:
-            print("overlaplength vs comb_formation Length",len(over_lap),len(comb_formation_set))
+            print("overlaplength vs comb_formation Length",np.count_nonzero(over_lap),np.count_nonzero(comb_formation_mask))
             return False
     
-    def give_comb_formation(self, cell_num: int, upper_right: (int, int), teeth_length: int, teeth_gap:int)-> list[(int, int)]:
+    def give_comb_formation(self, cell_num: int, upper_right: (int, int), teeth_length: int, teeth_gap:int)-> npt.NDArray:
         ## (x,y), (x+1,y)
-        #print("Number of cells we have", cell_num)
-        #teeth_gap += 1 
-        cell_num -= 1 
-        cur_point_x = upper_right[0]
-        cur_point_y = upper_right[1]
-        formation = []
-        length_left = teeth_length
-        formation.append((cur_point_x, cur_point_y))
-        gap = False
-        gap_left = teeth_gap
-        to_right = True
-
-        while True > 0:
-            if not(cell_num > 0):
-                break
-            if  gap == False:
-                # extending the teeth
-                if length_left > 0:
-                    cur_point_x -= 1
-                    cur_point_x %= 100
-                    formation.append((cur_point_x, cur_point_y))
-                    length_left -= 1
-                    cell_num -= 1
-                
-                else:
-                    #go down one extending the length of the comb
-                    gap = True
-                    cur_point_x += teeth_length # restore the x-axis
-                    cur_point_x %= 100
-                    length_left = teeth_length
-            else:
-                if gap_left > 0: 
-                    if  to_right == False:
-                        cur_point_y -= 1
-                        cur_point_x += 1 # move the coordinate back 
-                        cur_point_x %= 100
-                        cur_point_y %= 100
-                        formation.append((cur_point_x, cur_point_y))
-                        gap_left -= 1
-                        cell_num -= 1
-                        to_right = True
-                        
-                    else:
-                        cur_point_x -= 1 # move the coordinate back 
-                        cur_point_x %= 100
-                        if (cur_point_x, cur_point_y) not in formation:  
-                            # print("duplicate!")
-                            formation.append((cur_point_x, cur_point_y))
-                            cell_num -= 1
-                        to_right = False
-                         
-                else:
-                    to_right = True
-                    gap = False
-                    gap_left = teeth_gap
-        formation_set = list(set(map(tuple, formation)))
-        #print("size of future comb", len(formation_set))
-
-        return formation
+        key = (teeth_length, teeth_gap)
+        if key not in self.combs:
+            self.combs[key] = CombTemplates(teeth_length, teeth_gap, cell_num)
+        return self.combs[key].get(cell_num, upper_right)
 
 
     def find_upper_right(self,formation:list[(int, int)], info)-> (int, int):
@@ -236,27 +290,23 @@ class Player:
             y_coord = max(y_can)
             return (x_coord, y_coord)
     
+    def plan_formation_moves(self, amoeba_map, formation_map, periphery, movable_location, bacteria, budget):
+        """move_formation with the arguments of a self.plans lookup"""
+        return self.move_formation(budget, periphery, movable_location, np.argwhere(formation_map),
+                                   int(np.count_nonzero(amoeba_map)))
+
     def move_formation(self, num_movable_cell, movable_cell:list[(int,int)], movable_location:list[(int,int)], final_formation:list[(int,int)],current_size:int):
-        movable_cell_set =  {tuple(x) for x in movable_cell} 
-        final_formation_set ={tuple(x) for x in final_formation} 
-        movable_location_set = {tuple(x) for x in movable_location} 
-
-        cells_not_on_spot = movable_cell_set & movable_cell_set.symmetric_difference(final_formation_set)
-        # print(cells_not_on_spot)
-        cells_not_on_spot = list(cells_not_on_spot)
-        cells_not_on_spot.sort()
-        # print("cells_not_on_spot",cells_not_on_spot)
-        # print("wanting_to_move",final_formation_set & movable_cell_set.symmetric_difference(final_formation_set) )
-        destination = (final_formation_set & movable_cell_set.symmetric_difference(final_formation_set)) & movable_location_set
-         
-        destination = list(destination)
-        destination.sort()
-        retract=[]
-        extend = []
-        for i in range(min(num_movable_cell,len(cells_not_on_spot),len(destination))):
-            retract.append(cells_not_on_spot[i])
-            extend.append(destination[i])
-        formation = np.zeros((MAP_DIM,MAP_DIM),dtype=int)
+        movable_cell_mask = cells_to_mask(movable_cell)
+        final_formation_mask = cells_to_mask(final_formation)
+        movable_location_mask = cells_to_mask(movable_location)
+
+        # argwhere walks the board row by row, so both lists come out sorted
+        cells_not_on_spot = np.argwhere(movable_cell_mask & ~final_formation_mask)
+        destination = np.argwhere(final_formation_mask & ~movable_cell_mask & movable_location_mask)
+
+        n = min(num_movable_cell,len(cells_not_on_spot),len(destination))
+        retract = list(map(tuple, cells_not_on_spot[:n].tolist()))
+        extend = list(map(tuple, destination[:n].tolist()))
         """print("cells_not_on_spot",cells_not_on_spot)
         print("destination",destination)
         if len(retract) <= math.floor(current_size*0.001):
@@ -6,12 +6,12 @@ from amoeba_state import AmoebaState
 from typing import Tuple, List
 import numpy.typing as npt
 import constants
+from plan_cache import MovePlanner
+from players.morph_utils import MorphPlanner
 import matplotlib.pyplot as plt
 from enum import Enum
 import math
 
-turn = 0
-
 
 # ---------------------------------------------------------------------------- #
 #                               Constants                                      #
@@ -130,6 +130,50 @@ class Formation:
         self.map = np.logical_or(self.map, formation_map)
 
 
+class CombTemplate:
+    def __init__(self, generate) -> None:
+        """Comb formations built once at the map center and translated to where they are needed
+
+        Combs of the same size and tooth offset only differ by where their backbone sits, and every cell of a
+        comb is placed modulo the map size, so a comb centered on another column is the centered one rolled
+        along the x axis. Templates of previous sizes are dropped once the amoeba grows.
+
+        Args:
+            generate (Callable): builds a comb from (size, tooth_offset, center_x, center_y)
+        """
+        self.generate = generate
+        self.size = None
+        self.templates = {}
+
+    def get(self, size: int, tooth_offset=0, center_x=CENTER_X) -> npt.NDArray:
+        if size != self.size:
+            self.size = size
+            self.templates = {}
+        if tooth_offset not in self.templates:
+            self.templates[tooth_offset] = self.generate(size, tooth_offset, CENTER_X, CENTER_Y)
+        return np.roll(self.templates[tooth_offset], center_x - CENTER_X, axis=0)
+
+
+class BackboneTracker:
+    def __init__(self) -> None:
+        """Column of the comb backbone, read from the row and column occupancy of the amoeba
+
+        The backbone column is the smallest x among the cells with the largest y, unless the amoeba wraps around
+        the x edge of the map, in which case it is the first occupied column right of the center.
+        """
+        self.col: int = None
+
+    def update(self, amoeba_map: npt.NDArray) -> int:
+        occupied = amoeba_map != 0
+        occupied_x = occupied.any(axis=1)
+        occupied_y = occupied.any(axis=0)
+
+        max_y = constants.map_dim - 1 - int(np.argmax(occupied_y[::-1]))
+        self.col = int(np.argmax(occupied[:, max_y]))
+        if occupied_x[0] and occupied_x[-1]:
+            self.col = CENTER_X + 1 + int(np.argmax(occupied_x[CENTER_X + 1:]))
+        return self.col
+
 
 # ---------------------------------------------------------------------------- #
 #                               Main Player Class                              #
@@ -174,6 +218,7 @@ class Player:
         self.metabolism = metabolism
         self.goal_size = goal_size
         self.current_size = goal_size / 4
+        self.turn = 0
 
         # Class accessible percept variables, written at the start of each turn
         self.current_size: int = None
@@ -182,6 +227,10 @@ class Player:
         self.retractable_cells: List[Tuple[int, int]] = None
         self.extendable_cells: List[Tuple[int, int]] = None
         self.num_available_moves: int = None
+
+        self.combs = CombTemplate(self.generate_comb_formation)
+        self.backbone = BackboneTracker()
+        self.plans = MovePlanner("g2")
         
     def generate_comb_formation(self, size: int, tooth_offset=0, center_x=CENTER_X, center_y=CENTER_Y) -> npt.NDArray:
         formation = Formation()
@@ -223,41 +272,58 @@ class Player:
     ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
         """Function which takes a starting amoeba state and a desired amoeba state and generates a set of retracts and extends
         to morph the amoeba shape towards the desired shape.
+
+        Plans come from plan_morph_moves, through the translation invariant cache in self.plans.
         """
+        return self.plans.plan(self.plan_morph_moves, self.amoeba_map, desired_amoeba, self.retractable_cells,
+                               self.extendable_cells, self.bacteria_cells, self.num_available_moves)
 
-        current_points = map_to_coords(self.amoeba_map)
+    def plan_morph_moves(
+        self, amoeba_map: npt.NDArray, desired_amoeba: npt.NDArray, retractable_cells: List[Tuple[int, int]],
+        extendable_cells: List[Tuple[int, int]], bacteria_cells: List[Tuple[int, int]], num_available_moves: int
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        current_points = map_to_coords(amoeba_map)
         desired_points = map_to_coords(desired_amoeba)
+        planner = MorphPlanner(amoeba_map, retractable_cells, bacteria_cells)
+        retractable_cells = set(retractable_cells)
+        extendable_cells = set(extendable_cells)
 
         potential_retracts = [
             p
             for p in list(set(current_points).difference(set(desired_points)))
-            if p in self.retractable_cells
+            if p in retractable_cells
         ]
         potential_extends = [
             p
             for p in list(set(desired_points).difference(set(current_points)))
-            if p in self.extendable_cells
+            if p in extendable_cells
         ]
 
-        # Loop through potential extends, searching for a matching retract
+        # Each extend is paired with the nearest retract that keeps the move valid, nearest first
         retracts = []
         extends = []
-        for potential_extend in [p for p in potential_extends]:
+        if not potential_retracts or not potential_extends:
+            return retracts, extends
+
+        retract_coords = np.array(potential_retracts)
+        extend_coords = np.array(potential_extends)
+        distances = ((extend_coords[:, None, :] - retract_coords[None, :, :]) ** 2).sum(axis=2)
+        used = np.zeros(len(potential_retracts), dtype=bool)
+
+        for e, potential_extend in enumerate(potential_extends):
             # Ensure we only move as much as possible given our current metabolism
-            if len(extends) >= self.num_available_moves:
+            if len(extends) >= num_available_moves:
                 break
 
-            matching_retracts = list(potential_retracts)
-            matching_retracts.sort(key=lambda p: math.dist(p, potential_extend))
-
-            for i in range(len(matching_retracts)):
-                retract = matching_retracts[i]
+            for r in np.argsort(distances[e], kind="stable"):
+                if used[r]:
+                    continue
+                retract = potential_retracts[r]
                 # Matching retract found, add the extend and retract to our lists
-                if self.check_move(retracts + [retract], extends + [potential_extend]):
+                if planner.try_add(retract, potential_extend):
                     retracts.append(retract)
-                    potential_retracts.remove(retract)
                     extends.append(potential_extend)
-                    potential_extends.remove(potential_extend)
+                    used[r] = True
                     break
 
         # If we have moves remaining, try and get closer to the desired formation
@@ -392,8 +458,7 @@ class Player:
                 2. A list of positions the retracted cells have moved to
                 3. A byte of information (values range from 0 to 255) that the amoeba can use
         """
-        global turn
-        turn += 1
+        self.turn += 1
 
         self.store_current_percept(current_percept)
 
@@ -403,7 +468,7 @@ class Player:
         memory_fields = read_memory(info)
         if not memory_fields[MemoryFields.Initialized]:
             retracts, moves = self.get_morph_moves(
-                self.generate_comb_formation(self.current_size, 0)
+                self.combs.get(self.current_size, 0)
             )
             if len(moves) == 0:
                 info = change_memory_field(info, MemoryFields.Initialized, True)
@@ -411,14 +476,8 @@ class Player:
                 memory_fields = read_memory(info)
 
         if memory_fields[MemoryFields.Initialized]:
-            curr_coords = map_to_coords(self.amoeba_map)
-            curr_backbone_col = min(x for x, y in curr_coords if y == max(y for x, y in curr_coords))
-            
-            right_edge_cells = [(x, y) for x, y in curr_coords if x == constants.map_dim - 1]
-            left__edge_cells = [(x, y) for x, y in curr_coords if x == 0]
-            if len(right_edge_cells) and len(left__edge_cells):
-               curr_backbone_col = min(x for x, _ in curr_coords if x > CENTER_X) 
-            
+            curr_backbone_col = self.backbone.update(self.amoeba_map)
+
             vertical_shift = int(np.ceil(curr_backbone_col / 2) + 1) % 2
             if memory_fields[MemoryFields.Translating]:
                 offset = (curr_backbone_col + 1) - CENTER_X + 1
@@ -427,7 +486,7 @@ class Player:
                 offset = (curr_backbone_col + 1) - CENTER_X
                 info = change_memory_field(info, MemoryFields.Translating, True)
 
-            next_comb = self.generate_comb_formation(self.current_size, vertical_shift, CENTER_X + offset, CENTER_Y)
+            next_comb = self.combs.get(self.current_size, vertical_shift, CENTER_X + offset)
             retracts, moves = self.get_morph_moves(next_comb)
 
 
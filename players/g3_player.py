@@ -5,6 +5,40 @@ import logging
 from amoeba_state import AmoebaState
 
 
+class PeripheryIndex:
+    def __init__(self, periphery):
+        """Per-turn index of the periphery, its per-row extrema and the cells of the upper right quadrant
+
+            Args:
+                periphery (list): periphery cells of the current percept
+        """
+        cells = np.array(periphery, dtype=int).reshape(-1, 2)
+        self.xs = cells[:, 0]
+        self.ys = cells[:, 1]
+        # rows (y values) in the order they first appear on the periphery
+        rows, first = np.unique(self.ys, return_index=True)
+        self.rows = rows[np.argsort(first)]
+
+        self.min_x = np.full(100, np.iinfo(int).max)
+        self.max_x = np.full(100, -1)
+        np.minimum.at(self.min_x, self.ys, self.xs)
+        np.maximum.at(self.max_x, self.ys, self.xs)
+
+        self.upper_right = np.flatnonzero((self.xs < 50) & (self.ys > 50))
+
+    def left_row(self):
+        return list(zip(self.min_x[self.rows].tolist(), self.rows.tolist()))
+
+    def right_row(self):
+        return list(zip(self.max_x[self.rows].tolist(), self.rows.tolist()))
+
+    def sample_upper_right(self, rng, k):
+        """Up to k distinct periphery cells with x < 50 and y > 50, drawn in one go"""
+        cells = np.unique(np.stack([self.xs[self.upper_right], self.ys[self.upper_right]], axis=1), axis=0)
+        picks = rng.choice(len(cells), size=min(k, len(cells)), replace=False)
+        return list(map(tuple, cells[picks].tolist()))
+
+
 class Player:
     def __init__(self, rng: np.random.Generator, logger: logging.Logger, metabolism: float, goal_size: int,
                  precomp_dir: str) -> None:
@@ -41,46 +75,20 @@ class Player:
 
         self.turn = 0
 
-    def get_left_row(self, periphery):
+    def get_left_row(self, periphery, index=None):
         # Credit: G8
         # Gets left row of amoeba to be retracted
         # For each y coord, we want the one with the lowest x coord
+        return (index or PeripheryIndex(periphery)).left_row()
 
-        top_row_vals = {} # key: y, value: x
-        for (x, y) in periphery:
-            if y in top_row_vals:
-                if x < top_row_vals[y]:
-                    top_row_vals[y] = x
-            else:
-                top_row_vals[y] = x
-
-        top_row = []
-        for key, val in top_row_vals.items():
-            top_row.append((val, key)) # switched
-
-        return top_row
-
-    def get_right_row(self, periphery):
+    def get_right_row(self, periphery, index=None):
         # Credit: G8
         # Gets right row of amoeba to be retracted
         # For each y coord, we want the one with the highest x coord
+        return (index or PeripheryIndex(periphery)).right_row()
 
-        top_row_vals = {} # key: y, value: x
-        for (x, y) in periphery:
-            if y in top_row_vals:
-                if x > top_row_vals[y]:
-                    top_row_vals[y] = x
-            else:
-                top_row_vals[y] = x
-
-        top_row = []
-        for key, val in top_row_vals.items():
-            top_row.append((val, key)) # switched
-
-        return top_row
-
-    def create_formation(self, last_percept, current_percept, info) -> (list, list, int):
-        retract = self.get_left_row(current_percept.periphery)
+    def create_formation(self, last_percept, current_percept, info, index=None) -> (list, list, int):
+        retract = self.get_left_row(current_percept.periphery, index)
         sorted_retract = sorted(retract, key=lambda x: x[1])
         mini = len(sorted_retract)
         movable = self.find_movable_cells(sorted_retract, current_percept.periphery, current_percept.amoeba_map,
@@ -126,23 +134,19 @@ class Player:
         self.current_size = current_percept.current_size
         for i, j in current_percept.bacteria:
             current_percept.amoeba_map[i][j] = 1
+        index = PeripheryIndex(current_percept.periphery)
 
         if self.turn < 40:
-            return self.create_formation(last_percept, current_percept, info)
+            return self.create_formation(last_percept, current_percept, info, index)
         else:
             # move amoeba forward
             mini = min(5, len(current_percept.periphery) // 2)
             for i, j in current_percept.bacteria:
                 current_percept.amoeba_map[i][j] = 1
 
-            retract = set()
-            while len(retract) < 5:
-                i = self.rng.choice(current_percept.periphery, replace=False)
-                x = i[0]
-                y = i[1]
-                if x < 50 and y > 50:
-                    retract.add(tuple(i))
-            retract = list(retract)
+            retract = index.sample_upper_right(self.rng, 5)
+            if len(retract) < 5:
+                self.logger.info("Only {} periphery cells with x < 50 and y > 50 to retract".format(len(retract)))
 
             movable = self.find_movable_cells(retract, current_percept.periphery, current_percept.amoeba_map,
                                               current_percept.bacteria, mini)
@@ -165,35 +165,78 @@ def find_movable_cells(
         else movable_list
     )
 
-def retract_k(k: int, choices: list[cell], amoeba_map: np.ndarray) -> list[cell]:
+class ShapeAnalytics:
+    """Whole-board analytics of the ameoba, computed once per turn and shared
+    by all strategies.
+
+    @amoeba_map: map with known bacteria already marked, it is not copied so
+                 it must not change for the rest of the turn
+    """
+
+    def __init__(self, amoeba_map: np.ndarray) -> None:
+        self.amoeba_map = amoeba_map
+        self.ameoba = amoeba_map == State.ameoba.value
+        self.row_counts = np.count_nonzero(self.ameoba, axis=1)
+        self.col_counts = np.count_nonzero(self.ameoba, axis=0)
+
+        # number of empty 4-neighbours of every cell, wrapping around the edges
+        empty = (amoeba_map == State.empty.value).astype(np.int8)
+        self.exposure = (
+            np.roll(empty, 1, axis=1) + np.roll(empty, -1, axis=1) +
+            np.roll(empty, 1, axis=0) + np.roll(empty, -1, axis=0)
+        )
+
+    def ameoba_cells(self) -> list[cell]:
+        return list(zip(*np.where(self.ameoba)))
+
+    def cog(self) -> tuple[int, int]:
+        """Center of gravity of the ameoba."""
+        size = self.row_counts.sum()
+        x = np.dot(np.arange(len(self.row_counts)), self.row_counts) / size
+        y = np.dot(np.arange(len(self.col_counts)), self.col_counts) / size
+
+        return round(x), round(y)
+
+    def xmax(self) -> int:
+        """x-value of the "rightmost" ameoba cell, see BucketAttack._get_xmax."""
+        ameoba_xs = np.flatnonzero(self.row_counts)
+        xmin, xmax = ameoba_xs[0], ameoba_xs[-1]
+
+        # TODO: 5 is a magic number that should work... This is hacky though.
+        if xmax == 99 and xmin < 5:
+            return ameoba_xs[ameoba_xs <= 5][-1]
+
+        return xmax
+
+
+def retract_k(
+    k: int,
+    choices: list[cell],
+    amoeba_map: np.ndarray,
+    analytics: Optional[ShapeAnalytics] = None
+) -> list[cell]:
     """Select k cells to retract from choices (list of retractable cells) that
     ensures the ameoba will stay connected after retraction."""
     if k >= len(choices):
         return choices
+    if k <= 0:
+        return []
 
-    def exposure(cell) -> int:
-        x, y = cell
-        exposure = 0
-
-        for xn, yn in [
-            # index of 4 neighboring cells
-            (x, (y-1) % 100),
-            (x, (y+1) % 100),
-            ((x-1) % 100, y),
-            ((x+1) % 100, y)
-        ]:
-            if amoeba_map[xn][yn] == State.empty.value:
-                exposure += 1
-
-        return exposure
-
-    sorted_choices = sorted(
-        [(cell, exposure(cell)) for cell in choices],
-        key=lambda x: x[1],
-        reverse=True
-    )
+    if analytics is None:
+        analytics = ShapeAnalytics(amoeba_map)
+
+    xs, ys = np.array(choices).T
+    exposure = analytics.exposure[xs, ys]
+
+    # the k most exposed cells, ties broken by their order in choices
+    top = np.argpartition(-exposure, k - 1)[:k]
+    threshold = exposure[top].min()
+    above = np.flatnonzero(exposure > threshold)
+    tied = np.flatnonzero(exposure == threshold)[:k - len(above)]
+    picked = np.concatenate([above, tied])
+    picked = picked[np.lexsort((picked, -exposure[picked]))]
 
-    return [cell for cell, _ in sorted_choices[:k]]
+    return [choices[i] for i in picked]
 
 
 #------------------------------------------------------------------------------
@@ -209,7 +252,8 @@ class Strategy(ABC):
 
     @abstractmethod
     def move(
-        self, prev_state: AmoebaState, state: AmoebaState, memory: int
+        self, prev_state: AmoebaState, state: AmoebaState, memory: int,
+        analytics: Optional[ShapeAnalytics] = None
     ) -> tuple[list[cell], list[cell], int]:
 
         pass
@@ -218,7 +262,8 @@ class Strategy(ABC):
         self,
         curr_state: AmoebaState,
         memory: int,
-        target: set[cell]
+        target: set[cell],
+        analytics: Optional[ShapeAnalytics] = None
     ) -> tuple[list[cell], list[cell], int]:
         """Computes cells to retract and cells to move onto in a best effort way
         to morphy the ameoba into the target shape.
@@ -227,7 +272,11 @@ class Strategy(ABC):
         @memory: 1 byte memory of ameoba
         @target: target shape - represented by a list of cells - to morph
                  ameoba into
+        @analytics: analytics of curr_state's map, computed here if None
         """
+        if analytics is None:
+            analytics = ShapeAnalytics(curr_state.amoeba_map)
+
         # simple heuristic:
         # 1. find all cells we can retract and doesn't overlap with the target
         # 2. find all cells we can move onto once we retract all cells in step 1
@@ -240,23 +289,23 @@ class Strategy(ABC):
             curr_state.periphery, curr_state.amoeba_map, curr_state.bacteria
         ) 
 
-        ameoba_cells = list(zip(*np.where(curr_state.amoeba_map == State.ameoba.value)))
-        unoccupied_target_cells = target - set(ameoba_cells)
+        unoccupied_target_cells = {c for c in target if not analytics.ameoba[c]}
         to_occupy = set(occupiable_cells).intersection(unoccupied_target_cells)
 
         k = min(
             int(self.metabolism * curr_state.current_size), # max retractable cells
             len(to_occupy), len(retractable_cells)
         )
-        retract = retract_k(k, list(retractable_cells), curr_state.amoeba_map)
+        retract = retract_k(k, list(retractable_cells), curr_state.amoeba_map, analytics)
         extend = list(to_occupy)[:k]
 
         # debug
-        visualize_reshape(
-            list(target), ameoba_cells,
-            occupiable_cells, list(retractable_cells),
-            retract, extend
-        )
+        if debug:
+            visualize_reshape(
+                list(target), analytics.ameoba_cells(),
+                occupiable_cells, list(retractable_cells),
+                retract, extend
+            )
 
         return retract, extend, memory
 
@@ -267,7 +316,8 @@ class RandomWalk(Strategy):
         self.rng = rng
 
     def move(
-        self, prev_state: AmoebaState, state: AmoebaState, memory: int
+        self, prev_state: AmoebaState, state: AmoebaState, memory: int,
+        analytics: Optional[ShapeAnalytics] = None
     ) -> tuple[list[cell], list[cell], int]:
 
         mini = min(5, len(state.periphery) // 2)
@@ -358,14 +408,15 @@ class BucketAttack(Strategy):
     #             cell[1] -= 1
     #     return target_cells
 
-    def _get_cog(self, curr_state: AmoebaState) -> tuple[int, int]:
+    def _get_cog(
+        self, curr_state: AmoebaState, analytics: Optional[ShapeAnalytics] = None
+    ) -> tuple[int, int]:
         """Compute center of gravity of current Ameoba."""
-        ameoba_cells = np.array(list(zip(*np.where(curr_state.amoeba_map == State.ameoba.value))))
-        cog = (round(np.average(ameoba_cells[:,0])),round(np.average(ameoba_cells[:,1])))
-
-        return cog
+        return (analytics or ShapeAnalytics(curr_state.amoeba_map)).cog()
     
-    def _get_xmax(self, curr_state: AmoebaState) -> int:
+    def _get_xmax(
+        self, curr_state: AmoebaState, analytics: Optional[ShapeAnalytics] = None
+    ) -> int:
         """Returns the x-value of the "rightmost" Ameoba cell.
         
         Note: when the ameoba's bucket arm moves from x=99 to the right, the x-value
@@ -379,17 +430,11 @@ class BucketAttack(Strategy):
                         .                 .      .
                       (xmax)
         """
-        ameoba_xs, _ = np.where(curr_state.amoeba_map == State.ameoba.value)
-        xmin, xmax = min(ameoba_xs), max(ameoba_xs)
-
-        # TODO: 5 is a magic number that should work... This is hacky though.
-        if xmax == 99 and xmin < 5:
-            xs = ameoba_xs[ameoba_xs <= 5]
-            return max(xs)
+        return (analytics or ShapeAnalytics(curr_state.amoeba_map)).xmax()
 
-        return xmax
-
-    def _in_shape(self, curr_state: AmoebaState) -> bool:
+    def _in_shape(
+        self, curr_state: AmoebaState, analytics: Optional[ShapeAnalytics] = None
+    ) -> bool:
         """Returns a bool indicating if our bucket arms are in shape.
         
         In our implementation, *no memory bit* is needed to store information
@@ -405,17 +450,20 @@ class BucketAttack(Strategy):
         that we don't risk moving and not able to eat any bacteria along the
         way.
         """
-        xmax = self._get_xmax(curr_state)
+        analytics = analytics or ShapeAnalytics(curr_state.amoeba_map)
+        xmax = analytics.xmax()
         arms_expected = 1 + math.floor((curr_state.current_size - 3) / 7)
-        arms_got = len(np.where(curr_state.amoeba_map[xmax,:] == State.ameoba.value)[0])
+        arms_got = analytics.row_counts[xmax]
 
         return arms_got >= arms_expected
 
     def move(
-        self, prev_state: AmoebaState, state: AmoebaState, memory: int
+        self, prev_state: AmoebaState, state: AmoebaState, memory: int,
+        analytics: Optional[ShapeAnalytics] = None
     ) -> tuple[list[cell], list[cell], int]:
 
         size = (state.current_size)
+        analytics = analytics or ShapeAnalytics(state.amoeba_map)
 
         SHIFTING = True
         SHIFT_N = 16 #must be <= 16 currently
@@ -425,8 +473,8 @@ class BucketAttack(Strategy):
         cog  = (50, 50)
 
         # x-value of bucket arms
-        arm_xval = self._get_xmax(state)
-        if not self._in_shape(state):
+        arm_xval = self._get_xmax(state, analytics)
+        if not self._in_shape(state, analytics):
             arm_xval -= 1
 
  
@@ -449,7 +497,7 @@ class BucketAttack(Strategy):
             mem  = mem[:-5] + f'{self.shifted:b}' + mem[-4:]
         target_cells = self._get_target_cells(size, cog, arm_xval)
         memory = int(mem,2)
-        return self._reshape(state, memory, set(target_cells))
+        return self._reshape(state, memory, set(target_cells), analytics)
 
 
 #------------------------------------------------------------------------------
@@ -519,7 +567,9 @@ class Player:
         # current_size, metabolism, etc
         strategy = "bucket_attack"
 
-        return self.strategies[strategy].move(last_percept, current_percept, info)
+        analytics = ShapeAnalytics(current_percept.amoeba_map)
+
+        return self.strategies[strategy].move(last_percept, current_percept, info, analytics)
 
 
 #------------------------------------------------------------------------------
@@ -7,12 +7,15 @@ import numpy.typing as npt
 from typing import Tuple, List
 import logging
 from amoeba_state import AmoebaState
+from players.morph_utils import MorphPlanner
+from plan_cache import MovePlanner
 import math
 import time
 import matplotlib.pyplot as plt
 from enum import Enum
 import sys
 import random as rnd
+from collections import OrderedDict
 
 # CONSTS
 
@@ -21,6 +24,10 @@ MAX_BASE_LEN = min(MAP_DIM, 100)
 TOOTH_SPACING = 0
 SHIFTING_FREQ = 10
 # MAX_BASE_LEN = min(MAP_DIM, 100)
+TEMPLATE_CACHE_SIZE = 256
+STACK_CACHE_SIZE = 4
+# Part of the persisted formations' file name, bump it whenever generate_tooth_formation builds different formations
+FORMATIONS_VERSION = 1
 
 
 # ********* HELPER FUNCTIONS ********* #
@@ -127,6 +134,90 @@ def set_byte_info(values):
     return byte
 
 
+def tooth_offset(x_val: int) -> int:
+    return 0 if (x_val % SHIFTING_FREQ*2) < SHIFTING_FREQ else -1
+
+
+# ********* FORMATION TEMPLATES ********* #
+
+class FormationTemplates:
+    def __init__(self, generate, precomp_dir=None, sizes=()):
+        """Memoized tooth formations, the centered one per amoeba size and its rolled copies per offset
+
+            Args:
+                generate (Callable[[int], npt.NDArray]): builds the centered formation for an amoeba size
+                precomp_dir (str): directory the centered formations are persisted in, nothing is stored if None
+                sizes (Iterable[int]): amoeba sizes to have centered formations ready for
+        """
+        self.generate = generate
+        self.bases = {}
+        self.templates = OrderedDict()
+        self.stacks = OrderedDict()
+
+        path = None
+        if precomp_dir is not None:
+            path = os.path.join(precomp_dir, "tooth_formations_v{}_{}_{}_{}.npz".format(
+                FORMATIONS_VERSION, MAP_DIM, TOOTH_SPACING, MAX_BASE_LEN))
+            if os.path.isfile(path):
+                with np.load(path) as data:
+                    for size, packed in zip(data["sizes"].tolist(), data["packed"]):
+                        self.bases[size] = np.unpackbits(packed)[:MAP_DIM * MAP_DIM].reshape(MAP_DIM, MAP_DIM)
+
+        missing = [size for size in sizes if size not in self.bases]
+        for size in missing:
+            self.bases[size] = self.generate(size)
+        if path is not None and missing:
+            sizes = sorted(self.bases)
+            packed = np.array([np.packbits(self.bases[size]) for size in sizes])
+            tmp_path = "{}.{}.tmp.npz".format(path, os.getpid())
+            np.savez_compressed(tmp_path, sizes=np.array(sizes), packed=packed)
+            os.replace(tmp_path, path)
+
+    def base(self, size: int) -> npt.NDArray:
+        if size not in self.bases:
+            self.bases[size] = self.generate(size)
+        return self.bases[size]
+
+    def get(self, size: int, x_val: int) -> npt.NDArray:
+        """Formation for an amoeba of size with its base at column x_val, least recently used ones are evicted"""
+        key = (size, x_val - MAP_DIM//2, tooth_offset(x_val))
+        if key in self.templates:
+            self.templates.move_to_end(key)
+            return self.templates[key]
+
+        _, offset_x, offset_y = key
+        template = np.roll(np.roll(self.base(size), offset_x, 0), offset_y, 1)
+        self.templates[key] = template
+        if len(self.templates) > TEMPLATE_CACHE_SIZE:
+            self.templates.popitem(last=False)
+        return template
+
+    def stack(self, size: int) -> npt.NDArray:
+        """Boolean (x_val, x, y) stack of the formations for every base column"""
+        if size in self.stacks:
+            self.stacks.move_to_end(size)
+            return self.stacks[size]
+
+        x_vals = np.arange(MAP_DIM)
+        offsets_y = np.array([tooth_offset(x_val) for x_val in x_vals])
+        rows = (np.arange(MAP_DIM)[None, :] - (x_vals - MAP_DIM//2)[:, None]) % MAP_DIM
+        cols = (np.arange(MAP_DIM)[None, :] - offsets_y[:, None]) % MAP_DIM
+        stack = self.base(size).astype(bool)[rows[:, :, None], cols[:, None, :]]
+
+        self.stacks[size] = stack
+        if len(self.stacks) > STACK_CACHE_SIZE:
+            self.stacks.popitem(last=False)
+        return stack
+
+    def productive_offsets(self, size: int, retractable: npt.NDArray, extendable: npt.NDArray) -> npt.NDArray:
+        """Marks the base columns whose formation has both a retractable cell outside it and an extendable cell
+        inside it, the only ones get_morph_moves can return moves for"""
+        stack = self.stack(size)
+        can_extend = (stack & extendable).any(axis=(1, 2))
+        can_retract = (~stack & retractable).any(axis=(1, 2))
+        return can_extend & can_retract
+
+
 # ********* MAIN CODE ********* #
 
 class Player:
@@ -170,6 +261,10 @@ class Player:
         self.extendable_cells: List[Tuple[int, int]] = None
         self.num_available_moves: int = None
 
+        self.formations = FormationTemplates(self.generate_tooth_formation, precomp_dir,
+                                             range(int(goal_size / 4), goal_size))
+        self.plans = MovePlanner("g5")
+
     @staticmethod
     def generate_tooth_formation(amoeba_size: int) -> npt.NDArray:
         formation = np.zeros((MAP_DIM, MAP_DIM), dtype=np.int8)
@@ -219,15 +314,26 @@ class Player:
     def get_morph_moves(self, desired_amoeba: npt.NDArray) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
         """ Function which takes a starting amoeba state and a desired amoeba state and generates a set of retracts and extends
             to morph the amoeba shape towards the desired shape.
-        """
 
-        current_points = map_to_coords(self.amoeba_map)
+            Plans come from plan_morph_moves, through the translation invariant cache in self.plans.
+        """
+        return self.plans.plan(self.plan_morph_moves, self.amoeba_map, desired_amoeba, self.retractable_cells,
+                               self.extendable_cells, self.bacteria_cells, self.num_available_moves)
+
+    def plan_morph_moves(self, amoeba_map: npt.NDArray, desired_amoeba: npt.NDArray,
+                         retractable_cells: List[Tuple[int, int]], extendable_cells: List[Tuple[int, int]],
+                         bacteria_cells: List[Tuple[int, int]], num_available_moves: int
+                         ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        current_points = map_to_coords(amoeba_map)
         desired_points = map_to_coords(desired_amoeba)
+        planner = MorphPlanner(amoeba_map, retractable_cells, bacteria_cells)
+        retractable_cells = set(retractable_cells)
+        extendable_cells = set(extendable_cells)
 
         potential_retracts = [p for p in list(set(current_points).difference(set(desired_points))) if
-                              p in self.retractable_cells]
+                              p in retractable_cells]
         potential_extends = [p for p in list(set(desired_points).difference(set(current_points))) if
-                             p in self.extendable_cells]
+                             p in extendable_cells]
 
         potential_retracts.sort(key=lambda pos: pos[0])
         potential_extends.sort(key=lambda pos: pos[0])
@@ -239,21 +345,28 @@ class Player:
         # if len(potential_retracts) > self.num_available_moves:
         #     return [], []
 
-        # Loop through potential extends, searching for a matching retract
+        # Loop through potential extends, searching for a matching retract. A match also skips the following
+        # extend, as removing the matched one from the list being iterated over always did
         retracts = []
         extends = []
+        skip = False
         for potential_extend in potential_extends:
+            if skip:
+                skip = False
+                continue
+            if len(extends) >= num_available_moves:
+                break
             for potential_retract in potential_retracts:
-                if self.check_move(retracts + [potential_retract], extends + [potential_extend]):
+                if planner.try_add(potential_retract, potential_extend):
                     # matching retract found, add the extend and retract to our lists
                     retracts.append(potential_retract)
                     potential_retracts.remove(potential_retract)
                     extends.append(potential_extend)
-                    potential_extends.remove(potential_extend)
+                    skip = True
                     break
 
         # show_amoeba_map(self.amoeba_map, retracts, extends)
-        return retracts[:self.num_available_moves], extends[:self.num_available_moves]
+        return retracts[:num_available_moves], extends[:num_available_moves]
 
     # adapted from amoeba game code
     def check_move(self, retracts: List[Tuple[int, int]], extends: List[Tuple[int, int]]) -> bool:
@@ -355,26 +468,23 @@ class Player:
             mem.x_val = 50
             mem.tooth_shift = 0
 
-        while len(retracts) == 0 and len(moves) == 0:
-            offset_x = mem.x_val - MAP_DIM//2
-            offset_y = 0 if (mem.x_val % SHIFTING_FREQ*2) < SHIFTING_FREQ else -1
-            # if random.random() < 0.5:
-            #     mem.tooth_shift ^= 1
-            # #
-            # offset_y = -mem.tooth_shift
-            
-            target_formation = self.generate_tooth_formation(self.current_size)
-            target_formation = np.roll(target_formation, offset_x, 0)
-            # target_formation = self.shift_col(target_formation, mem.x_val+1, offset_y)
-            target_formation = np.roll(target_formation, offset_y, 1)
-            retracts, moves = self.get_morph_moves(target_formation)
-
-            if len(retracts) == 0 and len(moves) == 0:
-                mem.x_val = (mem.x_val + 1) % 100
-                print('--------------------')
-            # elif mem.x_val > 55 and rnd.choices([True, False], weights=(0.01, 0.99)):
-            #     mem.x_val = (mem.x_val + 1) % 100
-            
+        # only try the base columns where a move is possible at all, in the order the byte walks them
+        retractable = coords_to_map(self.retractable_cells).astype(bool)
+        extendable = coords_to_map(self.extendable_cells).astype(bool)
+        productive = self.formations.productive_offsets(self.current_size, retractable, extendable)
+
+        for _ in range(MAP_DIM):
+            if productive[mem.x_val]:
+                target_formation = self.formations.get(self.current_size, mem.x_val)
+                retracts, moves = self.get_morph_moves(target_formation)
+                if len(retracts) or len(moves):
+                    break
+
+            mem.x_val = (mem.x_val + 1) % 100
+            print('--------------------')
+        else:
+            self.logger.info("No formation offset gives a valid move")
+
         # print(cells_to_move)
         # if (self.num_available_moves // cells_to_move > 0):
         #     # amount of cols the comb should progress
@@ -3,6 +3,63 @@ import pickle
 import numpy as np
 import logging
 from amoeba_state import AmoebaState
+from player_trace import PlayerTrace
+
+
+class TurnAnalysis:
+    def __init__(self, amoeba_map):
+        """Row and column occupancy of the amoeba map, reduced once per turn and shared by every decision
+
+            Args:
+                amoeba_map (np.ndarray): 2D numpy array of the current amoeba map, updated in place by absorb
+        """
+        self.amoeba_map = amoeba_map
+        occupied = amoeba_map == 1
+        self.occupied_cols = occupied.any(axis=0)
+        self.occupied_rows = occupied.any(axis=1)
+        # number of occupied columns up to and including each column
+        self.cumulative_cols = np.cumsum(self.occupied_cols)
+
+    def absorb(self, cells):
+        """Marks cells (e.g. eaten bacteria) as amoeba in the map and in the reductions"""
+        if not len(cells):
+            return
+        rows, cols = np.array(cells).T
+        self.amoeba_map[rows, cols] = 1
+        self.occupied_rows[rows] = True
+        self.occupied_cols[cols] = True
+        self.cumulative_cols = np.cumsum(self.occupied_cols)
+
+    def first_occupied_col(self, start=0):
+        """Index of the first column at or after start holding an amoeba cell, None if there is none"""
+        before = self.cumulative_cols[start - 1] if start > 0 else 0
+        col = np.searchsorted(self.cumulative_cols, before + 1)
+        return int(col) if col < len(self.cumulative_cols) else None
+
+    def first_empty_col(self, start=0):
+        """Index of the first column at or after start without any amoeba cell, None if there is none"""
+        empty = np.flatnonzero(~self.occupied_cols[start:])
+        return int(empty[0]) + start if len(empty) else None
+
+    def split(self):
+        """Whether the occupied columns form more than one run, with the column before the second run"""
+        begin = self.first_occupied_col()
+        end = self.first_empty_col(begin) if begin is not None else None
+        resume = self.first_occupied_col(end) if end is not None else None
+        if resume is None:
+            return False, 0
+        return True, resume - 1
+
+    def connecting_col(self, row, cols):
+        """First of cols where an empty cell of row would touch every occupied neighbouring row, None if none"""
+        cols = np.asarray(cols) % 100
+        fits = self.amoeba_map[row, cols] == 0
+        if self.occupied_rows[row - 1]:
+            fits &= self.amoeba_map[row - 1, cols] == 1
+        if self.occupied_rows[row + 1]:
+            fits &= self.amoeba_map[row + 1, cols] == 1
+        hits = np.flatnonzero(fits)
+        return int(cols[hits[0]]) if len(hits) else None
 
 
 class Player:
@@ -35,6 +92,7 @@ class Player:
 
         self.rng = rng
         self.logger = logger
+        self.trace = PlayerTrace(logger)
         self.metabolism = metabolism
         self.goal_size = goal_size
         self.current_size = goal_size / 4
@@ -52,55 +110,62 @@ class Player:
                     2. A list of positions the retracted cells have moved to
                     3. A byte of information (values range from 0 to 255) that the amoeba can use
         """
-        self.logger.info(f'----------------Turn {info}-----------------')
+        self.trace.begin_turn(info)
+        self.trace.info('----------------Turn %s-----------------', info)
         self.current_size = current_percept.current_size
-        split, split_pt = self.split_amoeba(current_percept.amoeba_map)
+        analysis = TurnAnalysis(current_percept.amoeba_map)
+        split, split_pt = self.split_amoeba(current_percept.amoeba_map, analysis)
 
         mini = min(5, int(self.current_size*self.metabolism))
 
-        retract = self.sample_backend(current_percept.amoeba_map, mini, split)
-        for i, j in current_percept.bacteria:
-            current_percept.amoeba_map[i][j] = 1
+        retract = self.sample_backend(current_percept.amoeba_map, mini, split, analysis)
+        analysis.absorb(current_percept.bacteria)
 
-        amoeba_loc = np.stack(np.where(current_percept.amoeba_map==1)).T
-        amoeba_loc = amoeba_loc[amoeba_loc[:, 1].argsort()]
-        self.logger.info(f'amoeba: \n{amoeba_loc}')
+        self.trace.info('amoeba: \n%s', lambda: self.amoeba_locations(current_percept.amoeba_map))
+        self.trace.record(amoeba_map=lambda: current_percept.amoeba_map.astype(np.int8))
 
         movable = self.find_movable_cells(retract, current_percept.periphery, current_percept.amoeba_map,
                                           current_percept.bacteria)
         moves = self.get_branch_tips(retract, movable, current_percept.periphery, 
-                                        current_percept.amoeba_map, split, split_pt=split_pt)
+                                        current_percept.amoeba_map, split, split_pt=split_pt, analysis=analysis)
 
         move_num = min(mini, len(retract), len(moves))
-        self.logger.info(f'retract: \n{retract}')
-        self.logger.info(f'moves: \n{moves}')
+        self.trace.info('retract: \n%s', retract)
+        self.trace.info('moves: \n%s', moves)
+        self.trace.record(periphery=lambda: np.array(current_percept.periphery).reshape(-1, 2),
+                          retract=lambda: np.array(retract[:move_num]).reshape(-1, 2),
+                          moves=lambda: np.array(moves[:move_num]).reshape(-1, 2))
+        self.trace.end_turn()
         return retract[:move_num], moves[:move_num], info+1
 
-    def get_branch_tips(self, retract, movable, periphery, amoeba_map, split, split_pt):
+    def amoeba_locations(self, amoeba_map):
+        """Coordinates of the amoeba cells sorted by column, for tracing"""
+        amoeba_loc = np.stack(np.where(amoeba_map==1)).T
+        return amoeba_loc[amoeba_loc[:, 1].argsort()]
+
+    def get_branch_tips(self, retract, movable, periphery, amoeba_map, split, split_pt, analysis=None):
         """
         Get the rightmost tips of the brush branches, prioritizing shorter branches
         """
+        if analysis is None:
+            analysis = TurnAnalysis(amoeba_map)
         retract = np.array(retract)
         retract_even = retract[retract[:, 0]%2==0]
         retract_even[:, 1] = (retract_even[:, 1] + 1) % 100 # check cell next to the even retraction cell
-        prioritize_rows = []
-        curr_col = []
-        for i in range(retract_even.shape[0]):
-            if amoeba_map[tuple(retract_even[i])] == 0:
-                # no cell next to even retraction cell
-                prioritize_rows.append(retract_even[i, 0])
-                curr_col.append((retract_even[i, 1]-1) % 100)
+        # no cell next to even retraction cell
+        tips = retract_even[amoeba_map[retract_even[:, 0], retract_even[:, 1]] == 0]
+        prioritize_rows = tips[:, 0].tolist()
+        curr_col = ((tips[:, 1] - 1) % 100).tolist()
 
-        self.logger.info(f'prioritized rows: \n{prioritize_rows}')
+        self.trace.info('prioritized rows: \n%s', prioritize_rows)
 
         periphery = np.array(periphery)
         movable = set(movable)
-        self.logger.info(f'periphery: \n{periphery}')
+        self.trace.info('periphery: \n%s', periphery)
         if split:
         	rightmost_cells = periphery[periphery[:, 1]<=split_pt]
-        	nonsplit_rows = set(periphery[:, 0].tolist()) - set(rightmost_cells[:, 0].tolist())
-        	for row in nonsplit_rows:
-        		rightmost_cells = np.concatenate([rightmost_cells, periphery[periphery[:, 0]==row]])
+        	nonsplit = ~np.isin(periphery[:, 0], rightmost_cells[:, 0])
+        	rightmost_cells = np.concatenate([rightmost_cells, periphery[nonsplit]])
         else:
         	rightmost_cells = periphery
         rightmost_val = rightmost_cells[:, 1].max() if not split else rightmost_cells[rightmost_cells[:, 1]<=split_pt].max()+100
@@ -108,24 +173,16 @@ class Player:
         moves = []
         for i in range(len(prioritize_rows)):
             row = prioritize_rows[i]
-            prev_row = bool(np.where(amoeba_map[row-1, :]==1)[0].shape[0])
-            next_row = bool(np.where(amoeba_map[row+1, :]==1)[0].shape[0])
-            temp_move = (row, curr_col[i])
-            for col in range(rightmost_val, curr_col[i]-1, -1):
-                if amoeba_map[row, col%100] == 0 and \
-                    (not prev_row or amoeba_map[row-1, col%100] == 1) and \
-                    (not next_row or amoeba_map[row+1, col%100] == 1):
-                    # check if new location connects prev row and next row
-                    temp_move = (row, col%100)
-                    break
-            moves.append(temp_move)
-        self.logger.info(f'prioritized rows:{prioritize_rows}, moves: {moves}')
+            # check if new location connects prev row and next row
+            col = analysis.connecting_col(row, np.arange(rightmost_val, curr_col[i]-1, -1))
+            moves.append((row, col if col is not None else curr_col[i]))
+        self.trace.info('prioritized rows:%s, moves: %s', prioritize_rows, moves)
 
         rightmost_cells = rightmost_cells[rightmost_cells[:, 0]%2==1] # keep only odd rows
         if rightmost_cells.shape[0] == 0:
             return moves
 
-        self.logger.info(f'rightmost all: \n{rightmost_cells}')
+        self.trace.info('rightmost all: \n%s', rightmost_cells)
         rightmost_cells = rightmost_cells[(-rightmost_cells[:, 1]).argsort()] # sort cells by col
         rightmost_cells = rightmost_cells[np.unique(rightmost_cells[:, 0], return_index=True)[1]] # keep rightmost cell for each row
         
@@ -136,13 +193,13 @@ class Player:
                 target_col += 1
         else:
             target_col = rightmost_cells[rightmost_cells[:, 1]<=split_pt].max()+100
-        self.logger.info(f'rightmost unique: \n{rightmost_cells}')
+        self.trace.info('rightmost unique: \n%s', rightmost_cells)
         for i in range(rightmost_cells.shape[0]):
             col = rightmost_cells[i, 1]
             col = col if not split or col > split_pt else col+100
             if col < target_col:
                 move = (rightmost_cells[i, 0], (col+1)%100)
-                self.logger.info(f'move - movable: \n{move}, {move in movable}')
+                self.trace.info('move - movable: \n%s, %s', move, move in movable)
                 if move in movable:
                     moves.append(move)
 
@@ -176,27 +233,10 @@ class Player:
 
         return out
 
-    def split_amoeba(self, amoeba_map) -> bool:
-        split = False
-        amoeba_begin = False
-        amoeba_end = False
-        split_col = 0
-
-        for i in range(100):
-            curr_column = amoeba_map[:, i]
-            value = np.max(curr_column)
-            if value == 1:
-                if not amoeba_begin:
-                    amoeba_begin = True
-                elif amoeba_end:
-                    split = True
-                    split_col = i - 1
-                    break
-            elif value == 0:
-                if amoeba_begin:
-                    amoeba_end = True
-
-        return split, split_col
+    def split_amoeba(self, amoeba_map, analysis=None) -> bool:
+        if analysis is None:
+            analysis = TurnAnalysis(amoeba_map)
+        return analysis.split()
 
     def sample_column(self, column, num_cells):
         """Function that sample a column of the amoeba map
@@ -208,51 +248,32 @@ class Player:
         Returns:
             move_cells: list of cells to move
         """
-        move_cells = []
-        # prioritize even row
-        for i in range(column.shape[0]):
-            if len(move_cells) == num_cells:
-                break
-            if column[i] == 1 and i % 2 == 0:
-                move_cells.append(i)
-        # append odd row
-        for i in range(column.shape[0]):
-            if len(move_cells) == num_cells:
-                break
-            if column[i] == 1 and i % 2 != 0:
-                move_cells.append(i)
-        return move_cells
+        rows = np.flatnonzero(column == 1)
+        # prioritize even row, then append odd row
+        move_cells = np.concatenate([rows[rows % 2 == 0], rows[rows % 2 != 0]])
+        return move_cells[:num_cells].tolist()
         
     
-    def sample_backend(self, amoeba_map, num_cells, split=False) -> list:
+    def sample_backend(self, amoeba_map, num_cells, split=False, analysis=None) -> list:
         """Function that smaple the backend of the amoeba
         
         Args:
             amoeba_map (np.ndarray): 2D numpy array of the current amoeba map
             num_cells (int): number of cells to sample
             split (bool): whether the amoeba has split or not
+            analysis (TurnAnalysis): reductions of amoeba_map for this turn, computed here if None
         Returns:
             move_cells: list of cells to move
         """
         # TODO potential improvement: sample from i-1 column that contain movable cells
-        def find_move_cells(start, num_cells, amoeba_map):
-            for i in range(start, 100):
-                curr_column = amoeba_map[:, i]
-                if np.max(curr_column) == 1:
-                    sample_column_idx = i
-                    break
-            sample_column = amoeba_map[:, sample_column_idx]
-            return [(j, i) for j in self.sample_column(sample_column, num_cells)]
-        
+        if analysis is None:
+            analysis = TurnAnalysis(amoeba_map)
+
         start = 0
         if split:
-            start = None
             # move pass the first chunk of amoeba
-            for i in range(0, 100):
-                curr_column = amoeba_map[:, i]
-                if np.max(curr_column) == 0:
-                    start = i
-                    break
-        return find_move_cells(start, num_cells, amoeba_map)
+            start = analysis.first_empty_col()
+        sample_column_idx = analysis.first_occupied_col(start)
+        return [(j, sample_column_idx) for j in self.sample_column(amoeba_map[:, sample_column_idx], num_cells)]
                     
                     
@@ -9,6 +9,84 @@ import matplotlib.pyplot as plt
 import numpy.typing as npt
 import constants
 import math
+from collections import Counter
+
+from players.morph_utils import neighbors, is_connected, is_simple_point, articulation_points
+
+
+class MoveSearch:
+    def __init__(self, amoeba_map: npt.NDArray, periphery: List[Tuple[int, int]],
+                 bacteria: List[Tuple[int, int]]) -> None:
+        """Answers Player.check_move for a move that grows one (retract, extend) pair at a time
+
+            Reachability of the extends is tracked with a count of the periphery cells each empty cell can be
+            extended from, and connectivity with the cut vertices of the amoeba after the accepted pairs, so a
+            candidate pair is settled in constant time unless its retract is a cut vertex its extend might bridge.
+
+            Args:
+                amoeba_map (npt.NDArray): amoeba map of the current percept
+                periphery (List[Tuple[int, int]]): retractable cells
+                bacteria (List[Tuple[int, int]]): bacteria cells of the current percept
+        """
+        self.periphery = set(periphery)
+        self.bacteria = set(bacteria)
+        self.empty = amoeba_map == 0
+        self.occupied = amoeba_map > 0
+        self.connected = is_connected(self.occupied)
+        self.articulation = None
+        self.retracted = set()
+        self.extended = set()
+
+        # number of cells left on the periphery that each empty cell can be extended from
+        self.support = Counter()
+        for cell in self.periphery:
+            if cell not in self.bacteria:
+                self.support.update(n for n in neighbors(*cell) if self.empty[n])
+
+    def supports(self, cell: Tuple[int, int]) -> bool:
+        return cell in self.periphery and cell not in self.bacteria and cell not in self.retracted
+
+    def is_cut(self, cell: Tuple[int, int]) -> bool:
+        if is_simple_point(cell, self.occupied):
+            return False
+        if self.articulation is None:
+            self.articulation = articulation_points(self.occupied)
+        return cell in self.articulation
+
+    def allows(self, retract: Tuple[int, int], extend: Tuple[int, int]) -> bool:
+        """Whether check_move accepts the accepted pairs plus this one"""
+        if retract not in self.periphery:
+            return False
+
+        # every extend needs a periphery cell left to be extended from
+        if extend not in self.extended and self.support[extend] <= 0:
+            return False
+        if self.supports(retract):
+            for n in neighbors(*retract):
+                if (n in self.extended or n == extend) and self.support[n] <= 1:
+                    return False
+
+        if self.connected and not self.is_cut(retract):
+            # extend touches the periphery cell it is extended from, which stays
+            return True
+        if self.connected and sum(self.occupied[n] for n in neighbors(*extend) if n != retract) < 2:
+            # a cut retract is only bridged by an extend touching two of the pieces
+            return False
+
+        occupied = self.occupied.copy()
+        occupied[retract] = False
+        occupied[extend] = True
+        return is_connected(occupied)
+
+    def apply(self, retract: Tuple[int, int], extend: Tuple[int, int]) -> None:
+        if self.supports(retract):
+            self.support.subtract(n for n in neighbors(*retract) if self.empty[n])
+        self.retracted.add(retract)
+        self.extended.add(extend)
+        self.occupied[retract] = False
+        self.occupied[extend] = True
+        self.connected = True
+        self.articulation = None
 
 
 class Player:
@@ -158,14 +236,17 @@ class Player:
     def get_top_moves(self):
         potential_retracts = sorted( self.retractable_cells, key=lambda x: x[1] )
         potential_extends = sorted( self.extendable_cells, key=lambda x: x[1], reverse=True )
+        search = MoveSearch(self.amoeba_map, self.retractable_cells, self.bacteria_cells)
         
         # Loop through potential extends, searching for a matching retract
         retracts = []
         extends = []
         for potential_extend in potential_extends:
             for potential_retract in potential_retracts:
-                if self.check_move(retracts + [potential_retract], extends + [potential_extend]):
+                # same answer as self.check_move(retracts + [potential_retract], extends + [potential_extend])
+                if search.allows(potential_retract, potential_extend):
                     # matching retract found, add the extend and retract to our lists
+                    search.apply(potential_retract, potential_extend)
                     retracts.append(potential_retract)
                     potential_retracts.remove(potential_retract)
                     extends.append(potential_extend)
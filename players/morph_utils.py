@@ -0,0 +1,166 @@
+from collections import deque
+from typing import List, Set, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+import constants
+
+# ---------------------------------------------------------------------------- #
+#                     Connectivity helpers shared by players                    #
+# ---------------------------------------------------------------------------- #
+
+# 8-neighbourhood of a cell in clockwise order, starting north; even entries share an edge with the center
+RING_OFFSETS = [(0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1)]
+
+
+def neighbors(x: int, y: int) -> List[Tuple[int, int]]:
+    return [
+        (x, (y - 1) % constants.map_dim),
+        (x, (y + 1) % constants.map_dim),
+        ((x - 1) % constants.map_dim, y),
+        ((x + 1) % constants.map_dim, y),
+    ]
+
+
+def is_connected(occupied: npt.NDArray) -> bool:
+    cells = np.transpose(occupied.nonzero()).tolist()
+    if not cells:
+        return True
+
+    seen = np.zeros_like(occupied, dtype=bool)
+    start = tuple(cells[0])
+    seen[start] = True
+    queue = deque([start])
+    count = 1
+    while queue:
+        for n in neighbors(*queue.popleft()):
+            if occupied[n] and not seen[n]:
+                seen[n] = True
+                count += 1
+                queue.append(n)
+    return count == len(cells)
+
+
+def is_simple_point(point: Tuple[int, int], occupied: npt.NDArray) -> bool:
+    """True if the occupied neighbours of point stay connected to each other through its 8-neighbourhood, in which
+    case removing point can't disconnect the amoeba"""
+    x, y = point
+    ring = [occupied[(x + dx) % constants.map_dim, (y + dy) % constants.map_dim] for dx, dy in RING_OFFSETS]
+    if all(ring):
+        return True
+    # count each run of occupied ring cells once, at the first edge neighbour it contains
+    groups = sum(1 for i in range(0, 8, 2) if ring[i] and not (ring[i - 1] and ring[i - 2]))
+    return groups <= 1
+
+
+def articulation_points(occupied: npt.NDArray) -> Set[Tuple[int, int]]:
+    """Cut vertices of the occupied cells, the cells whose removal disconnects the amoeba"""
+    def occupied_neighbors(x, y):
+        return [n for n in neighbors(x, y) if occupied[n]]
+
+    order = {}
+    low = {}
+    articulation = set()
+    for root in zip(*map(np.ndarray.tolist, np.nonzero(occupied))):
+        if root in order:
+            continue
+        order[root] = low[root] = len(order)
+        root_children = 0
+        stack = [(root, None, iter(occupied_neighbors(*root)))]
+        while stack:
+            point, parent, adjacent = stack[-1]
+            advanced = False
+            for n in adjacent:
+                if n not in order:
+                    order[n] = low[n] = len(order)
+                    stack.append((n, point, iter(occupied_neighbors(*n))))
+                    advanced = True
+                    break
+                if n != parent:
+                    low[point] = min(low[point], order[n])
+            if advanced:
+                continue
+            stack.pop()
+            if parent is None:
+                continue
+            low[parent] = min(low[parent], low[point])
+            if parent == root:
+                root_children += 1
+            elif low[point] >= order[parent]:
+                articulation.add(parent)
+        if root_children > 1:
+            articulation.add(root)
+    return articulation
+
+
+# ---------------------------------------------------------------------------- #
+#                               Morph Planner                                  #
+# ---------------------------------------------------------------------------- #
+
+class MorphPlanner:
+    def __init__(self, amoeba_map: npt.NDArray, retractable_cells: List[Tuple[int, int]],
+                 bacteria_cells: List[Tuple[int, int]]) -> None:
+        """Incrementally validated set of (retract, extend) pairs, accepting exactly what check_move would
+
+        Every pair is checked against the moves accepted so far only: the extend (and any accepted extend next
+        to the retract) must stay next to a non retracted periphery cell, and the retract must leave the planned
+        amoeba connected. Connectivity is decided by a constant time local test on the 8-neighbourhood of the
+        retract, with a full flood fill only when that test is inconclusive.
+        """
+        self.amoeba_map = amoeba_map
+        self.occupied = amoeba_map > 0
+        self.periphery = set(retractable_cells)
+        self.bacteria = set(bacteria_cells)
+        self.retracts = set()
+        self.extends = set()
+        self.connected = is_connected(self.occupied)
+
+        # Number of non retracted periphery cells next to each free cell, a free cell is extendable while > 0
+        self.support = np.zeros(amoeba_map.shape, dtype=np.int16)
+        for x, y in self.periphery:
+            if (x, y) not in self.bacteria:
+                for n in neighbors(x, y):
+                    if amoeba_map[n] == 0:
+                        self.support[n] += 1
+
+    def supports(self, retract: Tuple[int, int]) -> bool:
+        return retract in self.periphery and retract not in self.bacteria
+
+    def is_extendable(self, cell: Tuple[int, int], retract: Tuple[int, int]) -> bool:
+        if cell == retract or cell in self.retracts:
+            return True
+        lost = 1 if self.supports(retract) and cell in neighbors(*retract) and self.amoeba_map[cell] == 0 else 0
+        return self.support[cell] - lost > 0
+
+    def try_add(self, retract: Tuple[int, int], extend: Tuple[int, int]) -> bool:
+        if retract not in self.periphery:
+            return False
+        if not self.is_extendable(extend, retract):
+            return False
+        for n in neighbors(*retract):
+            if n in self.extends and not self.is_extendable(n, retract):
+                return False
+
+        self.occupied[extend] = True
+        anchored = any(self.occupied[n] for n in neighbors(*extend) if n != retract)
+        if self.connected and anchored and is_simple_point(retract, self.occupied):
+            valid = True
+        else:
+            self.occupied[retract] = False
+            valid = is_connected(self.occupied)
+            self.occupied[retract] = True
+        self.occupied[extend] = False
+        if not valid:
+            return False
+
+        self.occupied[retract] = False
+        self.occupied[extend] = True
+        self.retracts.add(retract)
+        self.extends.add(extend)
+        self.connected = True
+        if self.supports(retract):
+            for n in neighbors(*retract):
+                if self.amoeba_map[n] == 0:
+                    self.support[n] -= 1
+        return True
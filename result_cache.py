@@ -0,0 +1,171 @@
+import ast
+import hashlib
+import json
+import os
+import time
+
+from player_host import player_module
+
+# Module the engine is entered through, it and the local modules it imports decide the outcome of a game
+ENGINE_ENTRY = "amoeba_game.py"
+
+# Package of the players, the engine imports every player but a game only runs one, so the engine's imports stop here
+PLAYERS_PACKAGE = "players"
+
+# Game parameters that are part of the key, in addition to the player code
+KEY_PARAMS = ["player_in", "seed", "size", "density", "metabolism", "final", "stall_detection"]
+
+
+def module_file(root_dir, name):
+    """Path relative to root_dir of the source of a dotted module name, None if it is not a local module"""
+    base = os.path.join(*name.split("."))
+    for rel_path in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(os.path.join(root_dir, rel_path)):
+            return rel_path
+    return None
+
+
+def local_imports(root_dir, rel_path):
+    """Local modules a source file imports, relative to root_dir, standard and installed packages are left out"""
+    with open(os.path.join(root_dir, rel_path), "rb") as f:
+        tree = ast.parse(f.read(), filename=rel_path)
+
+    package = os.path.dirname(rel_path).replace(os.sep, ".")
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package.split(".")[:len(package.split(".")) - node.level + 1] if package else []
+                base = ".".join(parent + ([base] if base else []))
+            names.append(base)
+            # from package import module
+            names.extend("{}.{}".format(base, alias.name) for alias in node.names if base)
+
+    paths = set()
+    for name in names:
+        rel = module_file(root_dir, name) if name else None
+        if rel is not None and rel != rel_path:
+            paths.add(rel)
+    return paths
+
+
+def import_closure(root_dir, roots, skip_package=None):
+    """Source files of the roots and every local module they import, directly or not
+
+        Args:
+            root_dir (str): directory modules are resolved against
+            roots (List[str]): source files to start from, relative to root_dir
+            skip_package (str): package whose modules are not followed, except for the roots
+        Returns:
+            List[str]: sorted relative paths
+    """
+    seen = set(roots)
+    stack = list(roots)
+    while stack:
+        for rel_path in local_imports(root_dir, stack.pop()):
+            if rel_path in seen or skip_package and rel_path.startswith(skip_package + os.sep):
+                continue
+            seen.add(rel_path)
+            stack.append(rel_path)
+    return sorted(seen)
+
+
+class ResultCache:
+    def __init__(self, cache_dir=os.path.join("cache", "results"), root_dir=None):
+        """On-disk cache of game results keyed by player and engine code hashes plus the game parameters
+
+            Games are deterministic given the seed, so a result stays valid until one of the hashed sources or
+            parameters changes. Games with seed 0 draw a fresh seed each launch and are never cached.
+
+            Args:
+                cache_dir (str): directory holding one json file per cached game
+                root_dir (str): repository root the hashed module paths are relative to, defaults to this file's
+        """
+        self.cache_dir = cache_dir
+        self.root_dir = root_dir if root_dir is not None else os.path.dirname(os.path.abspath(__file__))
+        self.file_hashes = {}
+        self.engine_modules = import_closure(self.root_dir, [ENGINE_ENTRY], skip_package=PLAYERS_PACKAGE)
+        self.player_modules = {}
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def file_hash(self, rel_path):
+        if rel_path not in self.file_hashes:
+            with open(os.path.join(self.root_dir, rel_path), "rb") as f:
+                self.file_hashes[rel_path] = hashlib.sha256(f.read()).hexdigest()
+        return self.file_hashes[rel_path]
+
+    def code_modules(self, player_in):
+        """Source files that decide a game of the player: the engine's modules and the ones the player imports"""
+        if player_in not in self.player_modules:
+            player_path = module_file(self.root_dir, player_module(player_in))
+            self.player_modules[player_in] = sorted(set(self.engine_modules).union(
+                import_closure(self.root_dir, [player_path])))
+        return self.player_modules[player_in]
+
+    def key(self, spec):
+        material = {
+            "code": {path: self.file_hash(path) for path in self.code_modules(str(spec["player_in"]))},
+            "params": {param: spec[param] for param in KEY_PARAMS},
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True).encode()).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, "{}.json".format(key))
+
+    def get(self, spec):
+        if spec["seed"] == 0:
+            return None
+
+        path = self.path(self.key(spec))
+        try:
+            with open(path) as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # refresh the timestamp so that eviction drops the least recently used entries first
+        os.utime(path)
+        self.hits += 1
+        return result
+
+    def put(self, spec, result):
+        if spec["seed"] == 0:
+            return
+
+        path = self.path(self.key(spec))
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+
+    def evict(self, max_age=None, max_bytes=None):
+        """Removes entries older than max_age seconds, then the least recently used ones until the cache fits
+        into max_bytes. Returns the number of removed entries."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        removed = 0
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            too_old = max_age is not None and now - mtime > max_age
+            too_big = max_bytes is not None and total > max_bytes
+            if not too_old and not too_big:
+                continue
+            os.remove(path)
+            total -= size
+            removed += 1
+
+        return removed
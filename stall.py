@@ -0,0 +1,118 @@
+import math
+from collections import deque
+from statistics import NormalDist
+
+import numpy as np
+
+# Thresholds of the stall policy, all of them are recorded with the results of games played under it
+STALL_DEFAULTS = {
+    "window": 100,
+    "confidence": 0.99,
+    "idle_turns": 50,
+    "repeat_turns": 50,
+    "flat_turns": 200,
+}
+
+
+def poisson_upper_bound(count, confidence):
+    """One-sided upper confidence bound on the mean of a Poisson variable of which count was observed
+
+        Uses the Wilson-Hilferty approximation of the chi-square quantile, which stays within a percent of the
+        exact bound for every count.
+    """
+    z = NormalDist().inv_cdf(confidence)
+    n = count + 1
+    return n * (1 - 1 / (9 * n) + z / (3 * math.sqrt(n))) ** 3
+
+
+class StallDetector:
+    def __init__(self, goal_size, max_turns, window=STALL_DEFAULTS["window"],
+                 confidence=STALL_DEFAULTS["confidence"], idle_turns=STALL_DEFAULTS["idle_turns"],
+                 repeat_turns=STALL_DEFAULTS["repeat_turns"], flat_turns=STALL_DEFAULTS["flat_turns"]):
+        """Decides when a game can be ended early because the amoeba will not reach the goal size in time
+
+            Growth is modelled as a Poisson process, the cells gained over the last window turns give an upper
+            confidence bound on the growth rate. A game is stalled once that bound, kept up over every remaining
+            turn, falls short of the goal, and the player shows no sign of getting unstuck: it has not made a
+            valid move that moved a cell for idle_turns turns, has only gone back to amoeba shapes it already had
+            since the size last changed for repeat_turns turns, or has not grown for flat_turns turns.
+
+            Args:
+                goal_size (int): size the amoeba must reach
+                max_turns (int): last turn of the game
+                window (int): turns the growth rate is measured over, no decision is made before
+                confidence (float): confidence of the growth rate bound
+                idle_turns (int): consecutive invalid or empty moves that count as the player being stuck
+                repeat_turns (int): consecutive turns on already seen shapes that count as the player being stuck
+                flat_turns (int): turns without growth that count as the player being stuck
+        """
+        self.goal_size = goal_size
+        self.max_turns = max_turns
+        self.thresholds = {"window": window, "confidence": confidence, "idle_turns": idle_turns,
+                           "repeat_turns": repeat_turns, "flat_turns": flat_turns}
+        self.sizes = deque(maxlen=window + 1)
+        self.shapes = set()
+        self.idle_streak = 0
+        self.repeat_streak = 0
+        self.flat_turns = 0
+        self.size_bound = None
+        self.report = None
+
+    def snapshot(self):
+        """State the next decisions depend on, as numpy arrays for checkpoints"""
+        return {
+            "stall_sizes": np.array(self.sizes, dtype=np.int64),
+            "stall_shapes": np.array(sorted(self.shapes), dtype=np.uint64),
+            "stall_streaks": np.array([self.idle_streak, self.repeat_streak, self.flat_turns], dtype=np.int64),
+        }
+
+    def restore(self, snapshot):
+        self.sizes.clear()
+        self.sizes.extend(snapshot["stall_sizes"].tolist())
+        self.shapes = set(snapshot["stall_shapes"].tolist())
+        self.idle_streak, self.repeat_streak, self.flat_turns = snapshot["stall_streaks"].tolist()
+
+    def update(self, turn, size, shape_hash, outcome):
+        """Records a played turn, returns True once the game is stalled
+
+            Args:
+                turn (int): turn just played
+                size (int): amoeba size after the turn
+                shape_hash (int): hash of the amoeba shape after the turn
+                outcome (str): "moved", "idle" for a valid move of no cells or "invalid"
+        """
+        if self.sizes and size == self.sizes[-1]:
+            self.flat_turns += 1
+            self.repeat_streak = self.repeat_streak + 1 if shape_hash in self.shapes else 0
+        else:
+            self.flat_turns = 0
+            self.repeat_streak = 0
+            self.shapes.clear()
+        self.shapes.add(shape_hash)
+        self.idle_streak = 0 if outcome == "moved" else self.idle_streak + 1
+        self.sizes.append(size)
+
+        window = self.thresholds["window"]
+        if len(self.sizes) <= window:
+            return False
+        rate = poisson_upper_bound(size - self.sizes[0], self.thresholds["confidence"]) / window
+        self.size_bound = size + rate * (self.max_turns - turn)
+        if self.size_bound >= self.goal_size:
+            return False
+
+        streaks = [("idle", self.idle_streak, "idle_turns"), ("repeating", self.repeat_streak, "repeat_turns"),
+                   ("flat", self.flat_turns, "flat_turns")]
+        reasons = [reason for reason, streak, threshold in streaks if streak >= self.thresholds[threshold]]
+        if not reasons:
+            return False
+
+        self.report = {
+            "turn": turn,
+            "size": size,
+            "reasons": reasons,
+            "size_bound": round(self.size_bound, 1),
+            "idle_streak": self.idle_streak,
+            "repeat_streak": self.repeat_streak,
+            "flat_turns": self.flat_turns,
+        }
+        return True
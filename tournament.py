@@ -0,0 +1,88 @@
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import os
+
+from dashboard import FEED_SIZE, Dashboard
+from result_cache import ResultCache
+from worker_pool import WorkerPool
+
+
+def get_specs(args):
+    specs = []
+    for player, seed, size, density, metabolism in itertools.product(args.players, args.seeds, args.sizes,
+                                                                      args.densities, args.metabolisms):
+        specs.append({"player_in": player, "seed": seed, "size": size, "density": density,
+                      "metabolism": metabolism, "final": args.final, "stall_detection": args.stall_detection})
+    return specs
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", "-p", nargs="+", default=["d"], help="Players taking part in the sweep")
+    parser.add_argument("--seeds", "-s", nargs="+", type=int, default=[2], help="Seeds to play every setting with")
+    parser.add_argument("--sizes", "-A", nargs="+", type=int, default=[15], help="Side lengths of the initial amoeba")
+    parser.add_argument("--densities", "-d", nargs="+", type=float, default=[0.3], help="Bacteria densities")
+    parser.add_argument("--metabolisms", "-m", nargs="+", type=float, default=[1.0], help="Metabolism values")
+    parser.add_argument("--final", "-l", type=int, default=1000, help="the maximum number of days")
+    parser.add_argument("--stall_detection", action="store_true", help="End games as stalled once the goal size "
+                                                                        "is out of reach")
+    parser.add_argument("--dashboard", action="store_true", help="Stream the games live to a web page served on "
+                                                                 "--address and --port")
+    parser.add_argument("--port", type=int, default=8080, help="Port of the dashboard, specify -1 to auto-assign")
+    parser.add_argument("--address", "-a", type=str, default="127.0.0.1", help="Address of the dashboard")
+    parser.add_argument("--no_browser", "-nb", action="store_true", help="Disable browser launching in dashboard "
+                                                                         "mode")
+    parser.add_argument("--processes", "-j", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--cache_dir", default=os.path.join("cache", "results"), help="Directory of the result "
+                                                                                     "cache")
+    parser.add_argument("--no_cache", action="store_true", help="Play every game even if its result is cached")
+    parser.add_argument("--cache_max_age", type=float, default=30, help="Days after which cached results are evicted")
+    parser.add_argument("--cache_max_size", type=float, default=100, help="Size in MB the result cache is trimmed to")
+    parser.add_argument("--out", "-o", default="results/tournament.jsonl", help="File the game results are "
+                                                                                 "written to, one json per line")
+    args = parser.parse_args()
+
+    specs = get_specs(args)
+    out_dir = os.path.dirname(args.out)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    cache = None
+    cached = []
+    pending = specs
+    if not args.no_cache:
+        cache = ResultCache(args.cache_dir)
+        cache.evict(max_age=args.cache_max_age * 24 * 60 * 60, max_bytes=args.cache_max_size * 1024 * 1024)
+        pending = []
+        for spec in specs:
+            result = cache.get(spec)
+            if result is None:
+                pending.append(spec)
+            else:
+                result["cached"] = True
+                cached.append(result)
+        print("{} of {} games found in the result cache".format(len(cached), len(specs)))
+
+    dashboard = None
+    dashboard_queue = None
+    if args.dashboard:
+        dashboard = Dashboard(args.address, args.port, not args.no_browser)
+        dashboard_queue = mp.Queue(FEED_SIZE)
+        dashboard.follow(dashboard_queue)
+
+    with WorkerPool(args.processes, dashboard_queue) as pool, open(args.out, "w") as f:
+        results = itertools.chain(cached, pool.run(pending))
+        for i, result in enumerate(results):
+            if cache is not None and not result.get("cached"):
+                cache.put({param: result[param] for param in specs[0]}, result)
+            f.write(json.dumps(result) + "\n")
+            print("[{}/{}] Player {} seed {}: size {}/{} in {} turns ({:.2f}s){}{}".format(
+                i + 1, len(specs), result["player_in"], result["seed"], result["final_size"], result["goal_size"],
+                result["turns"], result["time"], " stalled" if result.get("stalled") else "",
+                " (cached)" if result.get("cached") else ""))
+
+    if dashboard is not None:
+        dashboard_queue.put(None)
+        dashboard.close()
@@ -0,0 +1,129 @@
+import contextlib
+import copy
+import multiprocessing as mp
+import os
+import time
+
+from amoeba_game import AmoebaGame
+from dashboard import DashboardFeed
+from main import get_parser
+from player_host import load_player_class
+
+# Players kept warm by the current worker process, keyed by (player, metabolism, goal_size)
+_warm_players = {}
+
+# Queue the games of the current worker process publish their frames to, set when the pool feeds a dashboard
+_dashboard_queue = None
+
+
+class WarmPlayer:
+    def __init__(self, player_in):
+        """Player factory that constructs the player once and hands out a reset copy of it for every later game
+
+            The state left behind by the constructor, precomputation loaded from precomp_dir included, is
+            snapshotted after the first construction. Every later call restores that snapshot with the new game's
+            rng and logger wired in wherever the original ones were referenced. Players can take over with a
+            reset(rng, logger) method when they know better which of their attributes are per game.
+
+            Args:
+                player_in (str): player id, one of constants.possible_players
+        """
+        self.player_class = load_player_class(player_in)
+        self.player = None
+        self.snapshot = None
+        self.init_rng = None
+        self.init_logger = None
+        self.games = 0
+
+    def __call__(self, rng, logger, metabolism, goal_size, precomp_dir):
+        self.games += 1
+        if self.player is None:
+            self.player = self.player_class(rng=rng, logger=logger, metabolism=metabolism, goal_size=goal_size,
+                                            precomp_dir=precomp_dir)
+            if not hasattr(self.player, "reset"):
+                self.init_rng, self.init_logger = rng, logger
+                self.snapshot = copy.deepcopy(self.player.__dict__, {id(rng): rng, id(logger): logger})
+        elif hasattr(self.player, "reset"):
+            self.player.reset(rng, logger)
+        else:
+            self.player.__dict__ = copy.deepcopy(self.snapshot, {id(self.init_rng): rng,
+                                                                 id(self.init_logger): logger})
+
+        return self.player
+
+
+def game_args(player_in, seed, size=15, density=0.3, metabolism=1.0, final=1000, stall_detection=False):
+    """Headless, log-free argument namespace for running one game inside a worker"""
+    args = get_parser().parse_args(["--no_gui", "--no_vid", "--disable_logging", "--log_path", "",
+                                    "--player", str(player_in), "--seed", str(seed), "--size", str(size),
+                                    "--density", str(density), "--metabolism", str(metabolism),
+                                    "--final", str(final)] + (["--stall_detection"] if stall_detection else []))
+    return args
+
+
+def _set_dashboard_queue(feed_queue):
+    global _dashboard_queue
+    _dashboard_queue = feed_queue
+
+
+def dashboard_key(spec):
+    """Key of a game on the dashboard, unique within a sweep"""
+    return "Player {} seed {} (A = {}, d = {}, m = {})".format(spec["player_in"], spec["seed"], spec["size"],
+                                                               spec["density"], spec["metabolism"])
+
+
+def play_game(spec):
+    """Plays one game described by a dict of game_args keyword arguments, returns a result dict"""
+    args = game_args(**spec)
+    key = (args.player, args.metabolism, 4 * args.size ** 2)
+    if key not in _warm_players:
+        _warm_players[key] = WarmPlayer(args.player)
+    factory = _warm_players[key]
+
+    feed = None if _dashboard_queue is None else DashboardFeed(_dashboard_queue, dashboard_key(spec))
+
+    start_time = time.time()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = AmoebaGame(args, player_factory=factory, dashboard=feed)
+
+    result = dict(spec)
+    result.update({
+        "goal_reached": game.goal_reached,
+        "turns": game.game_end if game.goal_reached else game.turns,
+        "final_size": game.amoeba_size,
+        "goal_size": game.goal_size,
+        "time": time.time() - start_time,
+        "worker": os.getpid(),
+        "warm": factory.games > 1,
+        "plan_cache": game.plan_stats,
+        "stalled": game.stalled,
+        "stall": game.stall_detector.report if game.stall_detector else None,
+        "stall_policy": game.stall_detector.thresholds if game.stall_detector else None,
+    })
+    return result
+
+
+class WorkerPool:
+    def __init__(self, processes=None, dashboard_queue=None):
+        """Long-lived pool of game workers, each keeping its players initialized between games
+
+            Args:
+                processes (int): number of worker processes, defaults to the cpu count
+                dashboard_queue (multiprocessing.Queue): queue a Dashboard follows, the games publish their frames
+                    to it when given
+        """
+        self.pool = mp.Pool(processes, initializer=_set_dashboard_queue, initargs=(dashboard_queue,))
+
+    def run(self, specs):
+        """Plays every game spec and yields the result dicts as games finish"""
+        yield from self.pool.imap_unordered(play_game, specs)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,103 @@
+import numpy as np
+
+import constants
+
+# Keys are drawn from a fixed seed so that hashes compare across games, seeds and processes
+ZOBRIST_SEED = 4444
+
+_key_rng = np.random.default_rng(ZOBRIST_SEED)
+AMOEBA_KEYS = _key_rng.integers(0, 2 ** 64, size=(constants.map_dim, constants.map_dim), dtype=np.uint64)
+BACTERIA_KEYS = _key_rng.integers(0, 2 ** 64, size=(constants.map_dim, constants.map_dim), dtype=np.uint64)
+NORMALISED_KEYS = _key_rng.integers(0, 2 ** 64, size=(constants.map_dim, constants.map_dim), dtype=np.uint64)
+
+# Same keys as nested lists of python ints, indexing and XOR on them is much cheaper than on numpy scalars
+_AMOEBA_KEY_LISTS = AMOEBA_KEYS.tolist()
+_BACTERIA_KEY_LISTS = BACTERIA_KEYS.tolist()
+
+
+def anchor(counts):
+    """Translation covariant origin along one axis, given the number of amoeba cells on each line
+
+        The origin is the first line after the largest run of empty lines, ties are broken by the rotated
+        profile, so it moves along with the amoeba unless two rotations of the profile are identical. An amoeba
+        that leaves no line empty is anchored at the rotation of its profile that sorts first.
+    """
+    occupied = counts > 0
+    if not occupied.any():
+        return 0
+
+    if occupied.all():
+        candidates = np.arange(len(counts))
+    else:
+        starts = np.flatnonzero(occupied & ~np.roll(occupied, 1))
+        ends = np.flatnonzero(occupied & ~np.roll(occupied, -1))
+        # the run ending at ends[k - 1] is followed by the one starting at starts[k], unless a run wraps around 0
+        previous_ends = np.roll(ends, 1) if starts[0] < ends[0] else ends
+        gaps = (starts - previous_ends - 1) % len(counts)
+        candidates = starts[gaps == gaps.max()]
+    if len(candidates) == 1:
+        return int(candidates[0])
+    rotations = counts[(candidates[:, None] + np.arange(len(counts))[None, :]) % len(counts)]
+    return int(candidates[np.lexsort(rotations.T[::-1])[0]])
+
+
+def normalising_shift(occupied):
+    """Roll along both axes that brings the anchors of an occupancy map to the origin"""
+    return -anchor(occupied.sum(axis=1)), -anchor(occupied.sum(axis=0))
+
+
+class ZobristHash:
+    def __init__(self, map_state):
+        """64-bit Zobrist hashes of the board, the amoeba shape and the translation normalised amoeba shape
+
+            The board and shape hashes are XORs of one random key per occupied cell. The engine keeps them up to
+            date by toggling every cell that gains or loses an amoeba cell or a bacterium, in constant time per
+            cell. The normalised shape hash keys every amoeba cell by its position relative to the anchor of the
+            amoeba's row and column profiles. It is derived in one vectorized pass when asked for, at most once
+            between two changes of the amoeba.
+
+            Args:
+                map_state (numpy array): engine map, values > 0 are amoeba and -1 bacteria
+        """
+        self.reset(map_state)
+
+    def reset(self, map_state):
+        amoeba = map_state > 0
+        bacteria = map_state < 0
+        self.occupied = amoeba.copy()
+        self.shape_hash = int(np.bitwise_xor.reduce(AMOEBA_KEYS[amoeba])) if amoeba.any() else 0
+        self.bacteria_hash = int(np.bitwise_xor.reduce(BACTERIA_KEYS[bacteria])) if bacteria.any() else 0
+        self.normalised = None
+
+    def toggle_amoeba(self, x, y):
+        """Accounts for an amoeba cell appearing at or leaving (x, y)"""
+        self.shape_hash ^= _AMOEBA_KEY_LISTS[x][y]
+        self.occupied[x, y] = not self.occupied[x, y]
+        self.normalised = None
+
+    def toggle_bacteria(self, x, y):
+        """Accounts for a bacterium appearing at or leaving (x, y)"""
+        self.bacteria_hash ^= _BACTERIA_KEY_LISTS[x][y]
+
+    @property
+    def board_hash(self):
+        return self.shape_hash ^ self.bacteria_hash
+
+    @property
+    def normalised_hash(self):
+        if self.normalised is None:
+            cells = np.roll(self.occupied, normalising_shift(self.occupied), axis=(0, 1))
+            self.normalised = int(np.bitwise_xor.reduce(NORMALISED_KEYS[cells])) if cells.any() else 0
+        return self.normalised
+
+    def hashes(self):
+        return {"board": self.board_hash, "shape": self.shape_hash, "normalised_shape": self.normalised_hash}
+
+    def verify(self, map_state):
+        """Names of the hashes that differ from the ones recomputed from scratch for map_state, empty when the
+        incremental updates kept up with every change of the map"""
+        fresh = ZobristHash(map_state)
+        drift = [name for name, value in fresh.hashes().items() if self.hashes()[name] != value]
+        if not np.array_equal(self.occupied, fresh.occupied):
+            drift.append("occupied")
+        return drift